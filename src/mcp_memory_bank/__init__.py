@@ -8,10 +8,34 @@ a structured memory bank of project knowledge.
 FastMCP 2.0 compatible package structure.
 """
 
-from .server import mcp, main
+import importlib
 
 # Export the main server instance for FastMCP CLI discovery
-__all__ = ["mcp", "main"]
+__all__ = ["mcp", "main", "middlewares"]
+
+# Public names resolved on first access (PEP 562), so importing the package
+# does not pull in the server, templates or middlewares until they are used.
+_LAZY_ATTRIBUTES = {
+    "mcp": (".server", "mcp"),
+    "main": (".server", "main"),
+    "middlewares": (".middlewares", None),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    module = importlib.import_module(module_name, __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 # Package metadata
 __version__ = "1.0.0"
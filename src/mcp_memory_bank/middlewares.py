@@ -10,19 +10,237 @@ This module contains middleware classes that enhance the MCP server with:
 """
 
 import asyncio
-import hashlib
+import atexit
 import json
 import logging
 import os
+import queue
+import sys
 import time
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 
+_LOG_DIR = Path("memory_bank")
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Bounds for per-session middleware state: only the most recent sessions (and,
+# for the context-aware prompt history, their most recent technical tool
+# calls) are kept in memory.
+_MAX_TRACKED_TOOL_CALLS = 64
+_MAX_TRACKED_SESSIONS = 256
+
+# Sessions that never reach on_session_end are dropped once idle this long
+_SESSION_IDLE_TTL = 60 * 60  # 1 hour
+_SESSION_SWEEP_INTERVAL = 5 * 60  # 5 minutes
+
+# Content smaller than this is not checked for redundancy
+_MIN_REDUNDANCY_CHARS = 256
+_MIN_REDUNDANCY_WORDS = 40
+
+# Shared stand-in for calls made without arguments; only ever read from
+_EMPTY_ARGUMENTS: Dict[str, Any] = {}
+
+# Tools that trigger a context-aware prompt
+_TECHNICAL_TOOLS = frozenset({
+    'edit_file', 'run_terminal_cmd', 'search_replace', 'delete_file',
+    'create_file', 'write_file', 'modify_file', 'update_file'
+})
+
+
+def _count_tool_call(tool_counts: Counter, tool_name: str) -> None:
+    """
+    Increment a per-session tool count.
+
+    Tool names arrive as fresh strings on every call; interning them when
+    first stored lets every session's counter share one copy of each name.
+    """
+    if tool_name in tool_counts:
+        tool_counts[tool_name] += 1
+    else:
+        tool_counts[sys.intern(tool_name)] = 1
+
+
+class _LazyRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that creates its directory and file on first emit.
+
+    Records are written into the stream's buffer without a flush per record;
+    the log router flushes once the queue is drained, so a burst of records
+    costs a single write. The file size is tracked here rather than asked of
+    the stream, because the stdlib's seek/tell rollover check flushes the
+    buffer on every record. Sizes are counted in characters, like the stdlib's
+    allowance for the pending record.
+    """
+
+    log_dir_created = False  # shared: every middleware log lives in _LOG_DIR
+
+    def __init__(self, filename: Path, max_bytes: int, backup_count: int):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, delay=True)
+        self.stream_size = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.stream_size + len(msg) >= self.maxBytes:
+                self.doRollover()
+                self.stream = self._open()
+            self.stream.write(msg)
+            self.stream_size += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _open(self):
+        if not _LazyRotatingFileHandler.log_dir_created:
+            Path(self.baseFilename).parent.mkdir(exist_ok=True)
+            _LazyRotatingFileHandler.log_dir_created = True
+        stream = super()._open()
+        self.stream_size = os.fstat(stream.fileno()).st_size
+        return stream
+
+
+class _LogRouter(logging.Handler):
+    """
+    Dispatches queued records to the file handler of the logger that emitted them.
+
+    Handlers written to are flushed together once the queue is empty.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue):
+        super().__init__()
+        self.log_queue = log_queue
+        self.routes: Dict[str, _LazyRotatingFileHandler] = {}
+        self.unflushed: Set[_LazyRotatingFileHandler] = set()
+
+    def handle(self, record: logging.LogRecord) -> None:
+        handler = self.routes.get(record.name)
+        if handler is not None:
+            handler.handle(record)
+            self.unflushed.add(handler)
+        
+        if self.unflushed and self.log_queue.empty():
+            for handler in self.unflushed:
+                handler.flush()
+            self.unflushed.clear()
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves message formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _json_default(value: Any) -> Any:
+    """Encode datetimes (stored unformatted in log entries) as ISO strings."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Log entries are written as single-line JSON: without indent the stdlib
+# encoder stays on its C fast path, and one entry per line is easy to grep.
+_JSON_ENCODER = json.JSONEncoder(default=_json_default)
+
+
+class _JsonMessage:
+    """
+    Log argument rendered as JSON only when the record is formatted.
+
+    The rendered text is kept, so formatting a record more than once encodes
+    it only once. Values must not be mutated after they are logged.
+    """
+
+    __slots__ = ('value', 'text')
+
+    def __init__(self, value: Any):
+        self.value = value
+        self.text = None
+
+    def __str__(self) -> str:
+        if self.text is None:
+            self.text = _JSON_ENCODER.encode(self.value)
+        return self.text
+
+
+# Middleware loggers share one handler that only enqueues; a single listener
+# thread does the formatting and file writes so on_call_tool never blocks on
+# disk I/O.
+_LOG_QUEUE = queue.SimpleQueue()
+_LOG_ROUTER = _LogRouter(_LOG_QUEUE)
+_LOG_LISTENER = QueueListener(_LOG_QUEUE, _LOG_ROUTER)
+_LOG_QUEUE_HANDLER = _DeferredQueueHandler(_LOG_QUEUE)
+
+
+def _get_middleware_logger(name: str, file_name: str, max_bytes: int, backup_count: int) -> logging.Logger:
+    """
+    Return the named middleware logger, routing its records to a rotating file once.
+
+    Middlewares can be constructed more than once per process, so the handler
+    is only created on the first call. No filesystem work happens here: the
+    memory_bank directory and log file are created when the first record is
+    written, keeping middleware construction off the server startup path.
+    """
+    logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
+    
+    logger.setLevel(logging.INFO)
+    
+    handler = _LazyRotatingFileHandler(
+        _LOG_DIR / file_name,
+        max_bytes=max_bytes,
+        backup_count=backup_count
+    )
+    handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    
+    if not _LOG_ROUTER.routes:
+        _LOG_LISTENER.start()
+        atexit.register(_LOG_LISTENER.stop)
+    _LOG_ROUTER.routes[name] = handler
+    logger.addHandler(_LOG_QUEUE_HANDLER)
+    
+    return logger
+
+
+# Context-aware prompts are assembled from these static fragments around the
+# tool name; tools with a specific follow-up step map to (step prefix,
+# argument extractor) and get one extra numbered line.
+_CONTEXT_PROMPT_HEAD = "After using "
+_CONTEXT_PROMPT_STEPS = (
+    ", please analyze the changes made and:\n"
+    "1. Use MCP tools to understand the project context\n"
+    "2. Update relevant memory bank files with new knowledge\n"
+    "3. Ensure all changes are properly documented\n"
+    "4. Consider cross-references and dependencies\n"
+)
+
+
+def _prompt_target_file(arguments: Dict[str, Any]) -> str:
+    return arguments.get('target_file') or arguments.get('file_path', 'unknown')
+
+
+def _prompt_command(arguments: Dict[str, Any]) -> str:
+    return arguments.get('command', 'unknown')
+
+
+_FILE_CHANGE_STEP = ("5. Specifically analyze changes to: ", _prompt_target_file)
+
+_CONTEXT_PROMPT_STEP = {
+    'edit_file': _FILE_CHANGE_STEP,
+    'search_replace': _FILE_CHANGE_STEP,
+    'run_terminal_cmd': ("5. Analyze the results of command: ", _prompt_command)
+}
+
+
 class ContextAwarePromptInjectionMiddleware(Middleware):
     """
     Middleware that injects context-aware prompts after technical tools are used.
@@ -30,49 +248,32 @@ class ContextAwarePromptInjectionMiddleware(Middleware):
     """
     
     def __init__(self):
-        self.technical_tools = {
-            'edit_file', 'run_terminal_cmd', 'search_replace', 'delete_file',
-            'create_file', 'write_file', 'modify_file', 'update_file'
-        }
         self.session_data = {}
-        self.logger = self._setup_logger()
-    
-    def _setup_logger(self) -> logging.Logger:
-        """Set up logging for the middleware"""
-        logger = logging.getLogger('context_aware_prompt_injection')
-        logger.setLevel(logging.INFO)
-        
-        # Create memory_bank directory if it doesn't exist
-        memory_bank_dir = Path("memory_bank")
-        memory_bank_dir.mkdir(exist_ok=True)
-        
-        handler = RotatingFileHandler(
-            memory_bank_dir / "ContextAwarePrompts.log",
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
+        self.logger = _get_middleware_logger(
+            'context_aware_prompt_injection', "ContextAwarePrompts.log",
+            max_bytes=10*1024*1024,  # 10MB
+            backup_count=5
         )
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        
-        return logger
     
     async def on_call_tool(self, context: MiddlewareContext, tool_name: str, arguments: Dict[str, Any]) -> None:
         """Called when a tool is invoked"""
-        if tool_name in self.technical_tools:
+        if tool_name in _TECHNICAL_TOOLS:
+            arguments = arguments or _EMPTY_ARGUMENTS
             session_id = id(context)
+            session = self.session_data.get(session_id)
             
-            if session_id not in self.session_data:
-                self.session_data[session_id] = {
-                    'technical_tools_used': [],
+            if session is None:
+                if len(self.session_data) >= _MAX_TRACKED_SESSIONS:
+                    # Evict the oldest session (dicts keep insertion order)
+                    del self.session_data[next(iter(self.session_data))]
+                session = self.session_data[session_id] = {
+                    'technical_tools_used': deque(maxlen=_MAX_TRACKED_TOOL_CALLS),
                     'start_time': time.time()
                 }
             
-            self.session_data[session_id]['technical_tools_used'].append({
-                'tool': tool_name,
-                'timestamp': datetime.now().isoformat(),
+            session['technical_tools_used'].append({
+                'tool': sys.intern(tool_name),
+                'timestamp': time.time(),
                 'arguments': arguments
             })
             
@@ -80,31 +281,34 @@ class ContextAwarePromptInjectionMiddleware(Middleware):
             prompt = self._generate_context_prompt(tool_name, arguments)
             
             # Log the prompt injection
-            self.logger.info(f"Injecting context prompt for tool: {tool_name}")
-            self.logger.info(f"Prompt: {prompt}")
-            
-            # Store prompt for potential injection (in a real implementation,
-            # this would be injected into the conversation context)
-            self.session_data[session_id]['last_prompt'] = prompt
+            self.logger.info("Injecting context prompt for tool: %s\nPrompt: %s", tool_name, prompt)
     
     def _generate_context_prompt(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """Generate context-aware prompt based on the tool used"""
-        base_prompt = (
-            f"After using {tool_name}, please analyze the changes made and:\n"
-            "1. Use MCP tools to understand the project context\n"
-            "2. Update relevant memory bank files with new knowledge\n"
-            "3. Ensure all changes are properly documented\n"
-            "4. Consider cross-references and dependencies\n"
-        )
-        
-        if tool_name in ['edit_file', 'search_replace']:
-            file_path = arguments.get('target_file') or arguments.get('file_path', 'unknown')
-            return base_prompt + f"5. Specifically analyze changes to: {file_path}\n"
-        elif tool_name == 'run_terminal_cmd':
-            command = arguments.get('command', 'unknown')
-            return base_prompt + f"5. Analyze the results of command: {command}\n"
-        
-        return base_prompt
+        step = _CONTEXT_PROMPT_STEP.get(tool_name)
+        if step is None:
+            return "".join((_CONTEXT_PROMPT_HEAD, tool_name, _CONTEXT_PROMPT_STEPS))
+        
+        step_prefix, extract_detail = step
+        return "".join((
+            _CONTEXT_PROMPT_HEAD, tool_name, _CONTEXT_PROMPT_STEPS,
+            step_prefix, str(extract_detail(arguments)), "\n"
+        ))
+
+
+# Tools whose log entries get a semantic summary: (summary prefix, argument
+# whose value completes it, or None for a fixed summary)
+_SEMANTIC_SUMMARIES = {
+    'intelligent_context_executor': ("Executed intelligent context query: ", 'query'),
+    'suggest_files_to_update': ("Suggested file updates based on: ", 'context'),
+    'analyze_project_summary': ("Analyzed project summary and structure", None)
+}
+_SEMANTIC_SUMMARY_LIMIT = 100
+
+# Argument names whose values are never written to the tool log
+_REDACTED_ARGUMENTS = frozenset({
+    'password', 'token', 'secret', 'key', 'api_key', 'auth', 'credential'
+})
 
 
 class ToolLoggingMiddleware(Middleware):
@@ -114,61 +318,49 @@ class ToolLoggingMiddleware(Middleware):
     """
     
     def __init__(self):
-        self.semantic_tools = {
-            'intelligent_context_executor',
-            'suggest_files_to_update',
-            'analyze_project_summary'
-        }
-        self.logger = self._setup_logger()
-    
-    def _setup_logger(self) -> logging.Logger:
-        """Set up logging for tool calls"""
-        logger = logging.getLogger('tool_logging')
-        logger.setLevel(logging.INFO)
-        
-        # Create memory_bank directory if it doesn't exist
-        memory_bank_dir = Path("memory_bank")
-        memory_bank_dir.mkdir(exist_ok=True)
-        
-        handler = RotatingFileHandler(
-            memory_bank_dir / "Logs.log",
-            maxBytes=50*1024*1024,  # 50MB
-            backupCount=10
+        self.logger = _get_middleware_logger(
+            'tool_logging', "Logs.log",
+            max_bytes=50*1024*1024,  # 50MB
+            backup_count=10
         )
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        
-        return logger
     
     async def on_call_tool(self, context: MiddlewareContext, tool_name: str, arguments: Dict[str, Any]) -> None:
         """Called when a tool is invoked"""
+        # Building the entry is only worth it if the record will be written
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        arguments = arguments or _EMPTY_ARGUMENTS
+        
         # Sanitize arguments for logging
         sanitized_args = self._sanitize_arguments(arguments)
         
         log_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.now(),
             'tool': tool_name,
             'arguments': sanitized_args,
             'session_id': str(id(context))
         }
         
         # Add semantic summary for specific tools
-        if tool_name in self.semantic_tools:
+        if tool_name in _SEMANTIC_SUMMARIES:
             log_entry['semantic_summary'] = self._generate_semantic_summary(tool_name, arguments)
         
         # Log the tool call
-        self.logger.info(f"TOOL_CALL: {json.dumps(log_entry, indent=2)}")
+        self.logger.info("TOOL_CALL: %s", _JsonMessage(log_entry))
     
     def _sanitize_arguments(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Sanitize arguments to remove sensitive information"""
+        """
+        Sanitize arguments to remove sensitive information.
+
+        Always returns a new dict: the entry is encoded later on the listener
+        thread, so it must not share the caller's arguments dict.
+        """
         sanitized = {}
         for key, value in arguments.items():
             if isinstance(value, str) and len(value) > 1000:
                 sanitized[key] = f"<truncated:{len(value)}chars>"
-            elif key.lower() in ['password', 'token', 'secret', 'key']:
+            elif key.casefold() in _REDACTED_ARGUMENTS:
                 sanitized[key] = "<redacted>"
             else:
                 sanitized[key] = value
@@ -176,16 +368,18 @@ class ToolLoggingMiddleware(Middleware):
     
     def _generate_semantic_summary(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         """Generate semantic summary for specific tools"""
-        if tool_name == 'intelligent_context_executor':
-            query = arguments.get('query', 'unknown')
-            return f"Executed intelligent context query: {query[:100]}..."
-        elif tool_name == 'suggest_files_to_update':
-            context = arguments.get('context', 'unknown')
-            return f"Suggested file updates based on: {context[:100]}..."
-        elif tool_name == 'analyze_project_summary':
-            return "Analyzed project summary and structure"
-        
-        return "No semantic summary available"
+        summary = _SEMANTIC_SUMMARIES.get(tool_name)
+        if summary is None:
+            return "No semantic summary available"
+        
+        prefix, argument_name = summary
+        if argument_name is None:
+            return prefix
+        
+        value = str(arguments.get(argument_name, 'unknown'))
+        if len(value) > _SEMANTIC_SUMMARY_LIMIT:
+            return f"{prefix}{value[:_SEMANTIC_SUMMARY_LIMIT]}..."
+        return prefix + value
 
 
 class MemoryCompletenessEnforcementMiddleware(Middleware):
@@ -194,84 +388,77 @@ class MemoryCompletenessEnforcementMiddleware(Middleware):
     Triggers on session end and calls auto_detect_project_changes and suggest_files_to_update.
     """
     
-    def __init__(self):
-        self.session_activities = defaultdict(list)
-        self.logger = self._setup_logger()
+    MEMORY_TOOLS = frozenset({
+        'auto_detect_project_changes',
+        'suggest_files_to_update',
+        'update_memory_bank_file'
+    })
     
-    def _setup_logger(self) -> logging.Logger:
-        """Set up logging for memory completeness"""
-        logger = logging.getLogger('memory_completeness')
-        logger.setLevel(logging.INFO)
-        
-        # Create memory_bank directory if it doesn't exist
-        memory_bank_dir = Path("memory_bank")
-        memory_bank_dir.mkdir(exist_ok=True)
-        
-        handler = RotatingFileHandler(
-            memory_bank_dir / "MemoryCompleteness.log",
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
-        )
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    def __init__(self):
+        self.session_activities = defaultdict(Counter)  # session -> tool call counts
+        self.last_activity = {}  # session -> monotonic time of its last tool call
+        self.next_idle_sweep = time.monotonic() + _SESSION_SWEEP_INTERVAL
+        self.logger = _get_middleware_logger(
+            'memory_completeness', "MemoryCompleteness.log",
+            max_bytes=10*1024*1024,  # 10MB
+            backup_count=5
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        
-        return logger
     
     async def on_call_tool(self, context: MiddlewareContext, tool_name: str, arguments: Dict[str, Any]) -> None:
         """Track tool usage for completeness analysis"""
         session_id = str(id(context))
-        self.session_activities[session_id].append({
-            'tool': tool_name,
-            'timestamp': datetime.now().isoformat(),
-            'arguments': arguments
-        })
+        _count_tool_call(self.session_activities[session_id], tool_name)
+        
+        now = time.monotonic()
+        self.last_activity[session_id] = now
+        if now >= self.next_idle_sweep:
+            self._drop_idle_sessions(now)
+    
+    def _drop_idle_sessions(self, now: float) -> None:
+        """Forget sessions that never ended and have been idle past the TTL"""
+        for session_id, last_seen in list(self.last_activity.items()):
+            if now - last_seen > _SESSION_IDLE_TTL:
+                del self.last_activity[session_id]
+                self.session_activities.pop(session_id, None)
+        self.next_idle_sweep = now + _SESSION_SWEEP_INTERVAL
     
     async def on_session_end(self, context: MiddlewareContext) -> None:
         """Called when a session ends - enforce memory completeness"""
         session_id = str(id(context))
-        activities = self.session_activities.get(session_id, [])
+        self.last_activity.pop(session_id, None)
+        activities = self.session_activities.pop(session_id, None)
         
+        # Sessions that never called a tool have nothing to analyze
         if not activities:
             return
         
         # Analyze session activities
         completeness_report = self._analyze_completeness(activities)
         
-        # Log completeness analysis
-        self.logger.info(f"Session {session_id} completeness analysis:")
-        self.logger.info(json.dumps(completeness_report, indent=2))
-        
         # Generate completeness prompt
         prompt = self._generate_completeness_prompt(completeness_report)
         
-        # In a real implementation, this would trigger the MCP tools
-        # For now, we log the recommended actions
-        self.logger.info(f"Recommended actions: {prompt}")
+        # Log completeness analysis. In a real implementation, this would
+        # trigger the MCP tools; for now, we log the recommended actions
+        self.logger.info(
+            "Session %s completeness analysis:\n%s\nRecommended actions: %s",
+            session_id, _JsonMessage(completeness_report), prompt
+        )
     
-    def _analyze_completeness(self, activities: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_completeness(self, tool_counts: Counter) -> Dict[str, Any]:
         """Analyze session activities for completeness"""
-        tools_used = [activity['tool'] for activity in activities]
-        tool_counts = Counter(tools_used)
+        total_tools = tool_counts.total()
         
         # Check for memory-related tools
-        memory_tools = {
-            'auto_detect_project_changes',
-            'suggest_files_to_update',
-            'update_memory_bank_file'
-        }
-        
-        memory_tools_used = set(tools_used) & memory_tools
+        memory_tools_used = tool_counts.keys() & self.MEMORY_TOOLS
         
         return {
-            'total_tools': len(activities),
-            'unique_tools': len(set(tools_used)),
+            'total_tools': total_tools,
+            'unique_tools': len(tool_counts),
             'tool_counts': dict(tool_counts),
             'memory_tools_used': list(memory_tools_used),
-            'memory_completeness_score': len(memory_tools_used) / len(memory_tools),
-            'requires_memory_update': len(memory_tools_used) == 0 and len(activities) > 3
+            'memory_completeness_score': len(memory_tools_used) / len(self.MEMORY_TOOLS),
+            'requires_memory_update': len(memory_tools_used) == 0 and total_tools > 3
         }
     
     def _generate_completeness_prompt(self, report: Dict[str, Any]) -> str:
@@ -298,202 +485,197 @@ class CrossReferenceRedundancyMiddleware(Middleware):
     """
     
     def __init__(self):
-        self.content_index = {}  # MD5 hash -> file info
+        self.content_index = {}  # file path -> latest content info
         self.similarity_threshold = 0.3  # 30% similarity threshold
-        self.logger = self._setup_logger()
-    
-    def _setup_logger(self) -> logging.Logger:
-        """Set up logging for cross-reference analysis"""
-        logger = logging.getLogger('cross_reference')
-        logger.setLevel(logging.INFO)
-        
-        # Create memory_bank directory if it doesn't exist
-        memory_bank_dir = Path("memory_bank")
-        memory_bank_dir.mkdir(exist_ok=True)
-        
-        handler = RotatingFileHandler(
-            memory_bank_dir / "CrossReference.log",
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
-        )
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        self.logger = _get_middleware_logger(
+            'cross_reference', "CrossReference.log",
+            max_bytes=10*1024*1024,  # 10MB
+            backup_count=5
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        
-        return logger
     
     async def on_call_tool(self, context: MiddlewareContext, tool_name: str, arguments: Dict[str, Any]) -> None:
         """Monitor file updates for redundancy analysis"""
         if tool_name in ['edit_file', 'create_file', 'update_memory_bank_file']:
+            arguments = arguments or _EMPTY_ARGUMENTS
             file_path = arguments.get('target_file') or arguments.get('file_path')
             
             if file_path and 'memory_bank' in file_path:
-                await self._analyze_content_redundancy(file_path, arguments)
+                self._analyze_content_redundancy(file_path, arguments)
     
-    async def _analyze_content_redundancy(self, file_path: str, arguments: Dict[str, Any]) -> None:
+    def _analyze_content_redundancy(self, file_path: str, arguments: Dict[str, Any]) -> None:
         """Analyze content for redundancy and suggest cross-references"""
         try:
             # Get content from arguments or read from file
             content = arguments.get('content') or arguments.get('code_edit', '')
             
-            if not content:
+            # Edits below the minimum size are too small to be meaningfully
+            # redundant; drop any entry left from a larger earlier version
+            if len(content) < _MIN_REDUNDANCY_CHARS:
+                self.content_index.pop(file_path, None)
+                return
+            
+            # Skip re-analysis when the file's content has not changed
+            content_hash = hash(content)
+            indexed = self.content_index.get(file_path)
+            if indexed is not None and indexed['content_hash'] == content_hash:
                 return
             
-            # Calculate content hash
-            content_hash = hashlib.md5(content.encode()).hexdigest()
+            word_count = len(content.split())
+            if word_count < _MIN_REDUNDANCY_WORDS:
+                self.content_index.pop(file_path, None)
+                return
             
-            # Check for similar content
-            similar_files = self._find_similar_content(content)
+            # Check for similar content in other files
+            similar_files = self._find_similar_content(content, file_path)
             
             if similar_files:
-                # Log redundancy detection
-                self.logger.info(f"Redundancy detected in {file_path}")
-                self.logger.info(f"Similar content found in: {similar_files}")
-                
                 # Generate cross-reference suggestions
                 suggestions = self._generate_cross_reference_suggestions(file_path, similar_files)
-                self.logger.info(f"Cross-reference suggestions: {suggestions}")
+                
+                # Log redundancy detection
+                self.logger.info(
+                    "Redundancy detected in %s\nSimilar content found in: %s\nCross-reference suggestions: %s",
+                    file_path, similar_files, suggestions
+                )
             
-            # Update content index
-            self.content_index[content_hash] = {
+            # Update content index, replacing this file's previous entry.
+            # The preview's word set is kept so later lookups skip re-tokenizing.
+            content_preview = content[:200]
+            self.content_index[file_path] = {
                 'file_path': file_path,
-                'content_preview': content[:200],
-                'timestamp': datetime.now().isoformat(),
-                'word_count': len(content.split())
+                'content_hash': content_hash,
+                'content_preview': content_preview,
+                'preview_words': frozenset(content_preview.lower().split()),
+                'timestamp': time.time(),
+                'word_count': word_count
             }
             
         except Exception as e:
             self.logger.error(f"Error analyzing content redundancy: {e}")
     
-    def _find_similar_content(self, content: str) -> List[str]:
-        """Find files with similar content using simple text similarity"""
+    def _find_similar_content(self, content: str, file_path: str) -> List[str]:
+        """Find other files with similar content using simple text similarity"""
         similar_files = []
         content_words = set(content.lower().split())
+        content_size = len(content_words)
         
-        for content_hash, file_info in self.content_index.items():
-            existing_words = set(file_info['content_preview'].lower().split())
+        for indexed_path, file_info in self.content_index.items():
+            if indexed_path == file_path:
+                continue
+            
+            existing_words = file_info['preview_words']
+            
+            # Jaccard similarity can't exceed the ratio of the set sizes, so
+            # sets of very different size are ruled out without intersecting
+            existing_size = len(existing_words)
+            if min(content_size, existing_size) <= max(content_size, existing_size) * self.similarity_threshold:
+                continue
             
             # Calculate Jaccard similarity
             intersection = len(content_words & existing_words)
-            union = len(content_words | existing_words)
+            union = content_size + existing_size - intersection
             
             if union > 0:
                 similarity = intersection / union
                 if similarity > self.similarity_threshold:
-                    similar_files.append(file_info['file_path'])
+                    similar_files.append(indexed_path)
         
         return similar_files
     
     def _generate_cross_reference_suggestions(self, current_file: str, similar_files: List[str]) -> List[str]:
         """Generate cross-reference suggestions"""
         suggestions = []
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
         
         for similar_file in similar_files:
             # Extract meaningful reference
             file_name = Path(similar_file).stem
-            suggestions.append(f"[[see:{file_name} {datetime.now().strftime('%Y-%m-%d %H:%M')}]]")
+            suggestions.append(f"[[see:{file_name} {timestamp}]]")
         
         return suggestions
 
 
+class _SessionStats:
+    """Per-session tool usage tracked by the behavior profiler."""
+
+    __slots__ = ('tool_usage', 'start_time')
+
+    def __init__(self):
+        self.tool_usage = Counter()
+        self.start_time = time.monotonic()
+
+
 class AgentBehaviorProfilerMiddleware(Middleware):
     """
     Middleware that tracks agent behavior patterns and generates profiling reports.
     Monitors tool usage frequency and memory adherence.
     """
     
-    def __init__(self):
-        self.session_stats = defaultdict(lambda: {
-            'tool_usage': Counter(),
-            'start_time': time.time(),
-            'memory_tools_used': 0,
-            'core_tools_used': 0,
-            'total_tools': 0
-        })
-        self.memory_tools = {
-            'auto_detect_project_changes',
-            'suggest_files_to_update',
-            'update_memory_bank_file',
-            'intelligent_context_executor'
-        }
-        self.logger = self._setup_logger()
+    MEMORY_TOOLS = frozenset({
+        'auto_detect_project_changes',
+        'suggest_files_to_update',
+        'update_memory_bank_file',
+        'intelligent_context_executor'
+    })
     
-    def _setup_logger(self) -> logging.Logger:
-        """Set up logging for behavior profiling"""
-        logger = logging.getLogger('agent_behavior_profiler')
-        logger.setLevel(logging.INFO)
-        
-        # Create memory_bank directory if it doesn't exist
-        memory_bank_dir = Path("memory_bank")
-        memory_bank_dir.mkdir(exist_ok=True)
-        
-        handler = RotatingFileHandler(
-            memory_bank_dir / "AgentBehaviorProfile.log",
-            maxBytes=20*1024*1024,  # 20MB
-            backupCount=10
-        )
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    def __init__(self):
+        self.session_stats = {}
+        self.logger = _get_middleware_logger(
+            'agent_behavior_profiler', "AgentBehaviorProfile.log",
+            max_bytes=20*1024*1024,  # 20MB
+            backup_count=10
         )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        
-        return logger
     
     async def on_call_tool(self, context: MiddlewareContext, tool_name: str, arguments: Dict[str, Any]) -> None:
         """Track tool usage for behavior profiling"""
-        session_id = str(id(context))
-        stats = self.session_stats[session_id]
-        
-        # Update statistics
-        stats['tool_usage'][tool_name] += 1
-        stats['total_tools'] += 1
-        
-        if tool_name in self.memory_tools:
-            stats['memory_tools_used'] += 1
-        else:
-            stats['core_tools_used'] += 1
+        # Memory/core totals are derived from the per-tool counts at report time
+        _count_tool_call(self._ensure_session(str(id(context))).tool_usage, tool_name)
+    
+    def _ensure_session(self, session_id: str) -> _SessionStats:
+        """Return the stats for a session, creating them on its first tool call"""
+        stats = self.session_stats.get(session_id)
+        if stats is None:
+            if len(self.session_stats) >= _MAX_TRACKED_SESSIONS:
+                # Evict the oldest session (dicts keep insertion order)
+                del self.session_stats[next(iter(self.session_stats))]
+            stats = self.session_stats[session_id] = _SessionStats()
+        return stats
     
     async def on_session_end(self, context: MiddlewareContext) -> None:
         """Generate behavior profile report at session end"""
         session_id = str(id(context))
-        stats = self.session_stats[session_id]
         
-        if stats['total_tools'] == 0:
+        # Release the session entry up front; the report works on the local stats
+        stats = self.session_stats.pop(session_id, None)
+        if stats is None:
             return
         
         # Calculate behavior metrics
-        session_duration = time.time() - stats['start_time']
-        memory_adherence_ratio = stats['memory_tools_used'] / stats['total_tools']
+        session_duration = time.monotonic() - stats.start_time
+        tool_usage = stats.tool_usage
+        total_tools = tool_usage.total()
+        memory_tools_used = sum(tool_usage[tool] for tool in tool_usage.keys() & self.MEMORY_TOOLS)
+        memory_adherence_ratio = memory_tools_used / total_tools
         
         # Generate comprehensive report
         report = {
             'session_id': session_id,
             'timestamp': datetime.now().isoformat(),
             'session_duration_seconds': round(session_duration, 2),
-            'total_tools_used': stats['total_tools'],
-            'memory_tools_used': stats['memory_tools_used'],
-            'core_tools_used': stats['core_tools_used'],
+            'total_tools_used': total_tools,
+            'memory_tools_used': memory_tools_used,
+            'core_tools_used': total_tools - memory_tools_used,
             'memory_adherence_ratio': round(memory_adherence_ratio, 3),
-            'tool_usage_frequency': dict(stats['tool_usage']),
-            'most_used_tools': [
-                {'tool': tool, 'count': count}
-                for tool, count in stats['tool_usage'].most_common(5)
-            ],
+            'tool_usage_frequency': dict(tool_usage),
+            'most_used_tools': tool_usage.most_common(5),  # [(tool, count), ...]
             'behavior_classification': self._classify_behavior(memory_adherence_ratio, stats),
             'recommendations': self._generate_recommendations(memory_adherence_ratio, stats)
         }
         
         # Log comprehensive report
-        self.logger.info("=== AGENT BEHAVIOR PROFILE REPORT ===")
-        self.logger.info(json.dumps(report, indent=2))
-        
-        # Clean up session data
-        del self.session_stats[session_id]
+        self.logger.info("=== AGENT BEHAVIOR PROFILE REPORT ===\n%s", _JsonMessage(report))
     
-    def _classify_behavior(self, memory_adherence_ratio: float, stats: Dict[str, Any]) -> str:
+    def _classify_behavior(self, memory_adherence_ratio: float, stats: _SessionStats) -> str:
         """Classify agent behavior based on metrics"""
         if memory_adherence_ratio >= 0.7:
             return "Memory-Conscious Agent"
@@ -504,7 +686,7 @@ class AgentBehaviorProfilerMiddleware(Middleware):
         else:
             return "Memory-Negligent Agent"
     
-    def _generate_recommendations(self, memory_adherence_ratio: float, stats: Dict[str, Any]) -> List[str]:
+    def _generate_recommendations(self, memory_adherence_ratio: float, stats: _SessionStats) -> List[str]:
         """Generate recommendations based on behavior analysis"""
         recommendations = []
         
@@ -512,11 +694,11 @@ class AgentBehaviorProfilerMiddleware(Middleware):
             recommendations.append("Increase usage of memory bank tools for better context retention")
             recommendations.append("Consider calling auto_detect_project_changes more frequently")
         
-        if stats['total_tools'] > 50:
+        if stats.tool_usage.total() > 50:
             recommendations.append("High tool usage detected - consider optimizing workflow")
         
         # Check for tool diversity
-        unique_tools = len(stats['tool_usage'])
+        unique_tools = len(stats.tool_usage)
         if unique_tools < 5:
             recommendations.append("Limited tool diversity - explore more available tools")
         
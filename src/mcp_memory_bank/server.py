@@ -6,12 +6,18 @@ Each tool is completely self-contained and independent, with all required
 logic written directly within the tool function.
 """
 from mcp.server.fastmcp import FastMCP
-from datetime import datetime, timezone
 from typing import List
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import importlib
 import os
+import re
 import subprocess
 import socket
+import threading
+import time
 import logging
 import logging.handlers
 
@@ -35,48 +41,537 @@ mcp.add_middleware(AgentBehaviorProfilerMiddleware())
 
 
 
-# Import templates and guides as constants
-from .templates.memory_bank_instructions import TEMPLATE as MEMORY_BANK_INSTRUCTIONS
-from .templates.context.overview import TEMPLATE as OVERVIEW_TEMPLATE
-from .templates.context.stakeholders import TEMPLATE as STAKEHOLDERS_TEMPLATE
-from .templates.context.success_metrics import TEMPLATE as SUCCESS_METRICS_TEMPLATE
-from .templates.tech_specs.system_architecture import TEMPLATE as SYSTEM_ARCHITECTURE_TEMPLATE
-from .templates.tech_specs.data_flow import TEMPLATE as DATA_FLOW_TEMPLATE
-from .templates.tech_specs.api_reference import TEMPLATE as API_REFERENCE_TEMPLATE
-from .templates.devops.deployment_architecture import TEMPLATE as DEPLOYMENT_ARCHITECTURE_TEMPLATE
-from .templates.devops.ci_cd_pipeline import TEMPLATE as CI_CD_PIPELINE_TEMPLATE
-from .templates.dynamic_meta.change_log import TEMPLATE as CHANGE_LOG_TEMPLATE
-from .templates.dynamic_meta.decision_logs import TEMPLATE as DECISION_LOGS_TEMPLATE
-from .templates.dynamic_meta.config_map import TEMPLATE as CONFIG_MAP_TEMPLATE
-from .guides.structure import GUIDE as STRUCTURE_GUIDE
-from .guides.usage import GUIDE as USAGE_GUIDE
-from .guides.benefits import GUIDE as BENEFITS_GUIDE
-from .guides.setup import GUIDE as SETUP_GUIDE
-
-
-
-TEMPLATES = {
-    "memory_bank_instructions.md": MEMORY_BANK_INSTRUCTIONS,
-    "overview.md": OVERVIEW_TEMPLATE,
-    "stakeholders.md": STAKEHOLDERS_TEMPLATE,
-    "success_metrics.md": SUCCESS_METRICS_TEMPLATE,
-    "system_architecture.md": SYSTEM_ARCHITECTURE_TEMPLATE,
-    "data_flow.md": DATA_FLOW_TEMPLATE,
-    "api_reference.md": API_REFERENCE_TEMPLATE,
-    "deployment_architecture.md": DEPLOYMENT_ARCHITECTURE_TEMPLATE,
-    "ci_cd_pipeline.md": CI_CD_PIPELINE_TEMPLATE,
-    "change_log.md": CHANGE_LOG_TEMPLATE,
-    "decision_logs.md": DECISION_LOGS_TEMPLATE,
-    "config_map.md": CONFIG_MAP_TEMPLATE
+_MEMORY_BANK = Path("memory-bank")
+_memory_bank_ready = False
+
+
+def _ensure_memory_bank() -> Path:
+    """Create the memory-bank directory on first use and return its path."""
+    global _memory_bank_ready
+    if not _memory_bank_ready:
+        _MEMORY_BANK.mkdir(exist_ok=True)
+        _memory_bank_ready = True
+    return _MEMORY_BANK
+
+
+# Tools log to memory-bank/Logs.log through one shared handler, configured once
+# at import. The file is opened on the first record; tools create the
+# memory-bank directory before logging.
+_logger = logging.getLogger('memory_bank_tools')
+if not _logger.handlers:
+    _log_handler = logging.handlers.RotatingFileHandler(
+        _MEMORY_BANK / "Logs.log", maxBytes=1024*1024, backupCount=1, delay=True
+    )
+    _log_handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(levelname)s - %(funcName)s - %(message)s'
+    ))
+    _logger.setLevel(logging.INFO)
+    _logger.addHandler(_log_handler)
+    _logger.propagate = False
+
+
+# Templates and guides are imported on first use so that server startup only
+# pays for FastMCP and the middlewares, not the whole template tree.
+TEMPLATE_MODULES = {
+    "memory_bank_instructions.md": "templates.memory_bank_instructions",
+    "overview.md": "templates.context.overview",
+    "stakeholders.md": "templates.context.stakeholders",
+    "success_metrics.md": "templates.context.success_metrics",
+    "system_architecture.md": "templates.tech_specs.system_architecture",
+    "data_flow.md": "templates.tech_specs.data_flow",
+    "api_reference.md": "templates.tech_specs.api_reference",
+    "deployment_architecture.md": "templates.devops.deployment_architecture",
+    "ci_cd_pipeline.md": "templates.devops.ci_cd_pipeline",
+    "change_log.md": "templates.dynamic_meta.change_log",
+    "decision_logs.md": "templates.dynamic_meta.decision_logs",
+    "config_map.md": "templates.dynamic_meta.config_map"
+}
+
+GUIDE_MODULES = {
+    "setup": "guides.setup",
+    "usage": "guides.usage",
+    "benefits": "guides.benefits",
+    "structure": "guides.structure"
+}
+
+_GUIDE_NOT_FOUND = "Guide for {} not found. Available guides: " + ", ".join(GUIDE_MODULES)
+
+# Frontmatter placeholders filled in when templates are written out; matched in
+# a single pass so each template body is scanned once.
+_TEMPLATE_PLACEHOLDER_PATTERN = re.compile(r"(last_updated|created_by): \[(timestamp|contributor)\]")
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Keyword sets that trigger each tool suggestion in intelligent_context_executor,
+# matched against whole query words.
+_TOOL_SUGGESTION_RULES = (
+    (frozenset({'create', 'generate', 'template', 'new'}), "🛠️ generate_memory_bank_template - Create new template files"),
+    (frozenset({'analyze', 'summary', 'overview'}), "🛠️ analyze_project_summary - Analyze project information"),
+    (frozenset({'update', 'modify', 'change', 'edit'}), "🛠️ suggest_files_to_update - Get file update suggestions"),
+    (frozenset({'route', 'organize', 'structure'}), "🛠️ smart_project_analysis_and_routing - Analyze and route content"),
+    (frozenset({'detect', 'changes', 'diff'}), "🛠️ auto_detect_project_changes - Detect project changes"),
+)
+
+# Keyword tables for analyze_project_summary. Matching is by substring of the
+# lowercased summary, and list order is the order keywords are reported in.
+_SUMMARY_TECH_KEYWORDS = (
+    'api', 'database', 'frontend', 'backend', 'server', 'client',
+    'authentication', 'authorization', 'security', 'deployment',
+    'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'cloud',
+    'microservices', 'monolith', 'rest', 'graphql', 'websocket',
+    'react', 'vue', 'angular', 'node', 'python', 'java', 'go',
+    'mongodb', 'postgresql', 'mysql', 'redis', 'elasticsearch',
+    'machine learning', 'ai', 'analytics', 'monitoring', 'logging'
+)
+
+_SUMMARY_BUSINESS_KEYWORDS = (
+    'user', 'customer', 'business', 'revenue', 'profit', 'cost',
+    'market', 'competition', 'strategy', 'growth', 'scalability',
+    'performance', 'efficiency', 'productivity', 'automation',
+    'integration', 'workflow', 'process', 'optimization'
+)
+
+# First matching entry wins
+_SUMMARY_PROJECT_TYPES = (
+    (frozenset({'web app', 'website', 'frontend', 'ui', 'ux'}), "Web Application"),
+    (frozenset({'api', 'backend', 'server', 'microservice'}), "Backend Service"),
+    (frozenset({'mobile', 'ios', 'android', 'app'}), "Mobile Application"),
+    (frozenset({'data', 'analytics', 'machine learning', 'ai'}), "Data/Analytics Platform"),
+    (frozenset({'devops', 'infrastructure', 'deployment'}), "DevOps/Infrastructure"),
+    (frozenset({'game', 'gaming', 'entertainment'}), "Gaming/Entertainment"),
+)
+
+_SUMMARY_ARCHITECTURE_PATTERNS = (
+    (frozenset({'microservice', 'distributed', 'scalable'}), "Microservices Architecture"),
+    (frozenset({'event', 'message', 'queue', 'async'}), "Event-Driven Architecture"),
+    (frozenset({'api', 'rest', 'graphql'}), "API-First Architecture"),
+    (frozenset({'layer', 'tier', 'separation'}), "Layered Architecture"),
+    (frozenset({'serverless', 'lambda', 'function'}), "Serverless Architecture"),
+)
+
+_SUMMARY_TECH_STACK = {
+    'frontend': ('react', 'vue', 'angular', 'svelte', 'html', 'css', 'javascript', 'typescript'),
+    'backend': ('node', 'python', 'java', 'go', 'php', 'ruby', 'c#', 'scala'),
+    'database': ('postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sqlite'),
+    'infrastructure': ('docker', 'kubernetes', 'aws', 'azure', 'gcp', 'heroku', 'netlify'),
+    'tools': ('git', 'jenkins', 'github', 'gitlab', 'jira', 'slack'),
+}
+
+# Recommendation added when its keyword (a tech or business keyword) is found
+_SUMMARY_RECOMMENDATIONS = (
+    ('security', "🔒 Implement comprehensive security measures including authentication, authorization, and data encryption"),
+    ('scalability', "📈 Design for horizontal scaling with load balancing and distributed architecture"),
+    ('performance', "⚡ Implement caching strategies and performance monitoring"),
+    ('api', "🔌 Design RESTful APIs with proper versioning and documentation"),
+)
+
+_SUMMARY_KEYWORDS = frozenset().union(
+    _SUMMARY_TECH_KEYWORDS,
+    _SUMMARY_BUSINESS_KEYWORDS,
+    *(words for words, _ in _SUMMARY_PROJECT_TYPES),
+    *(words for words, _ in _SUMMARY_ARCHITECTURE_PATTERNS),
+    *_SUMMARY_TECH_STACK.values(),
+)
+
+# Rules for suggest_files_to_update: a file is suggested when any of its words
+# appears as a substring of the lowercased input text. Order is report order.
+_FILE_UPDATE_RULES = (
+    # Context files
+    (frozenset({'overview', 'description', 'purpose', 'goal', 'objective'}),
+     'context/overview.md', "Project overview and description updates"),
+    (frozenset({'stakeholder', 'team', 'role', 'responsibility', 'owner'}),
+     'context/stakeholders.md', "Stakeholder information and roles"),
+    (frozenset({'metric', 'kpi', 'success', 'performance', 'measure'}),
+     'context/success_metrics.md', "Success metrics and KPIs"),
+    # Technical specifications
+    (frozenset({'architecture', 'design', 'pattern', 'structure', 'component'}),
+     'tech_specs/system_architecture.md', "System architecture and design patterns"),
+    (frozenset({'api', 'endpoint', 'rest', 'graphql', 'interface'}),
+     'tech_specs/api_reference.md', "API documentation and endpoints"),
+    (frozenset({'data', 'flow', 'pipeline', 'process', 'transformation'}),
+     'tech_specs/data_flow.md', "Data flow and processing pipelines"),
+    (frozenset({'module', 'service', 'microservice', 'component'}),
+     'tech_specs/modules/', "Module-specific technical specifications"),
+    # DevOps files
+    (frozenset({'deploy', 'deployment', 'infrastructure', 'server', 'cloud'}),
+     'devops/deployment_architecture.md', "Deployment and infrastructure setup"),
+    (frozenset({'ci/cd', 'pipeline', 'build', 'test', 'automation'}),
+     'devops/ci_cd_pipeline.md', "CI/CD pipeline and automation"),
+    # Dynamic metadata
+    (frozenset({'change', 'update', 'modify', 'fix', 'feature'}),
+     'dynamic_meta/change_log.md', "Change log and modification history"),
+    (frozenset({'decision', 'choice', 'option', 'alternative', 'rationale'}),
+     'dynamic_meta/decision_logs.md', "Decision logs and rationale"),
+    (frozenset({'config', 'configuration', 'setting', 'environment', 'variable'}),
+     'dynamic_meta/config_map.md', "Configuration and environment settings"),
+)
+
+_FILE_UPDATE_KEYWORDS = frozenset().union(*(words for words, _, _ in _FILE_UPDATE_RULES))
+
+# Keyword tables for smart_project_analysis_and_routing, matched by substring
+# of the lowercased content. Category order breaks score ties; first matching
+# content type wins.
+_ROUTING_CATEGORY_INDICATORS = {
+    'context': frozenset({'overview', 'stakeholder', 'business', 'goal', 'objective', 'requirement', 'user', 'customer'}),
+    'tech_specs': frozenset({'architecture', 'design', 'pattern', 'structure', 'component'}),
+    'devops': frozenset({'deploy', 'infrastructure', 'server', 'cloud', 'pipeline', 'ci/cd', 'monitoring', 'build'}),
+    'dynamic_meta': frozenset({'change', 'decision', 'config', 'update', 'modify', 'log', 'history', 'version'}),
 }
 
-GUIDES = {
-    "setup": SETUP_GUIDE,
-    "usage": USAGE_GUIDE,
-    "benefits": BENEFITS_GUIDE,
-    "structure": STRUCTURE_GUIDE
+_ROUTING_CONTENT_TYPES = (
+    (frozenset({'class', 'function', 'method', 'import', 'def', 'var', 'const'}), 'code'),
+    (frozenset({'# ', '## ', '### ', 'markdown', 'documentation'}), 'documentation'),
+    (frozenset({'meeting', 'discussion', 'notes', 'agenda'}), 'meeting_notes'),
+    (frozenset({'decision', 'choice', 'option', 'alternative'}), 'decision_record'),
+    (frozenset({'bug', 'issue', 'fix', 'error', 'problem'}), 'issue_report'),
+)
+
+# Words the per-category routing rules look for
+_ROUTING_RULE_KEYWORDS = frozenset({
+    'overview', 'stakeholder', 'team', 'role', 'metric', 'kpi', 'success', 'performance',
+    'architecture', 'design', 'pattern', 'api', 'endpoint', 'rest', 'graphql', 'data', 'flow', 'pipeline',
+    'deploy', 'deployment', 'infrastructure', 'ci/cd', 'build',
+    'change', 'update', 'modify', 'config', 'configuration', 'setting',
+})
+
+# Key topics are matched against whole words, in this order
+_ROUTING_TOPIC_KEYWORDS = ('api', 'database', 'frontend', 'backend', 'authentication', 'security', 'deployment', 'testing')
+
+_ROUTING_KEYWORDS = frozenset().union(
+    _ROUTING_RULE_KEYWORDS,
+    *_ROUTING_CATEGORY_INDICATORS.values(),
+    *(words for words, _ in _ROUTING_CONTENT_TYPES),
+)
+
+_TEMPLATE_CACHE = {}
+_ENCODED_TEMPLATE_CACHE = {}
+_GUIDE_CACHE = {}
+_FILE_TEXT_CACHE = {}
+
+# Bound for _FILE_TEXT_CACHE: the oldest entries are evicted past this many
+_MAX_CACHED_FILE_TEXTS = 128
+# Guards _FILE_TEXT_CACHE updates; files are read from worker threads
+_FILE_TEXT_CACHE_LOCK = threading.Lock()
+
+
+def _load_template(name: str) -> str:
+    """Return the template text for ``name``, importing its module on first use."""
+    template = _TEMPLATE_CACHE.get(name)
+    if template is None:
+        module = importlib.import_module(f".{TEMPLATE_MODULES[name]}", __package__)
+        template = _TEMPLATE_CACHE[name] = module.TEMPLATE
+    return template
+
+
+def _encode_for_write(text: str) -> bytes:
+    """Encode text exactly as ``Path.write_text(text, encoding='utf-8')`` would."""
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode('utf-8')
+
+
+def _load_template_bytes(name: str) -> bytes:
+    """Return the template for ``name`` encoded for writing, encoding it once."""
+    encoded = _ENCODED_TEMPLATE_CACHE.get(name)
+    if encoded is None:
+        encoded = _ENCODED_TEMPLATE_CACHE[name] = _encode_for_write(_load_template(name))
+    return encoded
+
+
+def _load_guide(section: str) -> str:
+    """Return the guide text for ``section``, importing its module on first use."""
+    guide = _GUIDE_CACHE.get(section)
+    if guide is None:
+        module = importlib.import_module(f".{GUIDE_MODULES[section]}", __package__)
+        guide = _GUIDE_CACHE[section] = module.GUIDE
+    return guide
+
+
+_utc_timestamp_cache = (None, "")
+
+
+def _utc_timestamp() -> str:
+    """
+    Return the current UTC time as 'YYYY-MM-DD HH:MM:SS UTC'.
+
+    The text only changes once per second, so it is formatted once per second
+    and reused by the tools in between.
+    """
+    global _utc_timestamp_cache
+    second = int(time.time())
+    cached_second, cached_text = _utc_timestamp_cache
+    if second != cached_second:
+        cached_text = "%04d-%02d-%02d %02d:%02d:%02d UTC" % time.gmtime(second)[:6]
+        _utc_timestamp_cache = (second, cached_text)
+    return cached_text
+
+
+def _read_memory_file(file_path: Path) -> str:
+    """
+    Return the text of a memory bank file, re-reading it only when it changed.
+
+    Entries are keyed on the path and validated against the file's mtime and
+    size, so repeated context lookups do not re-read unchanged files. Entries
+    for files that have disappeared are dropped, and the cache is capped at
+    _MAX_CACHED_FILE_TEXTS entries. Lookups are single dict reads; updates
+    and evictions hold _FILE_TEXT_CACHE_LOCK, so concurrent readers never see
+    the cache mid-change. The file itself is read outside the lock.
+    """
+    key = str(file_path)
+    try:
+        stat_result = file_path.stat()
+    except FileNotFoundError:
+        with _FILE_TEXT_CACHE_LOCK:
+            _FILE_TEXT_CACHE.pop(key, None)
+        raise
+    
+    cached = _FILE_TEXT_CACHE.get(key)
+    if cached is not None and cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size:
+        return cached[2]
+    
+    content = file_path.read_text(encoding='utf-8')
+    with _FILE_TEXT_CACHE_LOCK:
+        _FILE_TEXT_CACHE.pop(key, None)
+        if len(_FILE_TEXT_CACHE) >= _MAX_CACHED_FILE_TEXTS:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _FILE_TEXT_CACHE[next(iter(_FILE_TEXT_CACHE))]
+        _FILE_TEXT_CACHE[key] = (stat_result.st_mtime_ns, stat_result.st_size, content)
+    return content
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_contributor_id() -> str:
+    """
+    Get contributor ID from environment or git.
+
+    The identity does not change while the server runs, so it is resolved once
+    instead of probing the environment (and possibly forking git) per call.
+    """
+    contributor_id = None
+    for env_var in ["GIT_AUTHOR_NAME", "USER", "USERNAME"]:
+        value = os.environ.get(env_var)
+        if value:
+            contributor_id = value.strip()
+            break
+    
+    if not contributor_id:
+        try:
+            result = subprocess.run(
+                ["git", "config", "user.name"], 
+                capture_output=True, text=True, timeout=5
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                contributor_id = result.stdout.strip()
+        except:
+            pass
+    
+    if not contributor_id:
+        try:
+            contributor_id = f"user-{socket.gethostname()}"
+        except:
+            contributor_id = "unknown-user"
+    
+    return contributor_id
+
+
+def _existing_memory_bank_paths(relative_paths) -> set:
+    """
+    Return which of ``relative_paths`` exist under the memory bank.
+
+    Paths are relative to memory-bank, with a trailing '/' for directories.
+    Each parent directory is listed once, so classifying a batch of suggested
+    files costs one listing per directory instead of one stat per file. Names
+    missing from a listing are confirmed with exists(), which still finds them
+    on case-insensitive filesystems when only the case differs.
+    """
+    listings = {}
+    existing = set()
+    for relative_path in relative_paths:
+        parent, _, name = relative_path.rstrip('/').rpartition('/')
+        names = listings.get(parent)
+        if names is None:
+            try:
+                names = frozenset(os.listdir(_MEMORY_BANK / parent))
+            except OSError:
+                names = frozenset()
+            listings[parent] = names
+        if name in names or (_MEMORY_BANK / relative_path).exists():
+            existing.add(relative_path)
+    return existing
+
+
+_CONFIG_FILE_SUFFIXES = ('.json', '.yaml', '.yml', '.toml', '.ini', '.conf')
+_SCAN_SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', 'memory-bank'})
+
+
+def _scan_project_files(root: str, modified_after: float, limit: int = 10) -> tuple:
+    """
+    Walk the project once, collecting recently modified files and config files.
+
+    Returns (recent_files, config_files), each capped at ``limit``. VCS,
+    dependency, cache and memory-bank directories are skipped, symlinked
+    directories are not followed, and the walk stops once both lists are full.
+    """
+    recent_files = []
+    config_files = []
+    pending_dirs = [root]
+    while pending_dirs:
+        try:
+            with os.scandir(pending_dirs.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SCAN_SKIP_DIRS:
+                        pending_dirs.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+                
+                if len(config_files) < limit and os.path.normcase(entry.name).endswith(_CONFIG_FILE_SUFFIXES):
+                    config_files.append(entry.path)
+                if len(recent_files) < limit and not entry.name.startswith('.') and entry.stat().st_mtime > modified_after:
+                    recent_files.append(entry.path)
+            except OSError:
+                continue
+            
+            if len(recent_files) >= limit and len(config_files) >= limit:
+                return recent_files, config_files
+    
+    return recent_files, config_files
+
+
+# Section bodies for generated templates, keyed by the category directory the
+# file lives in; the first category found in the path wins.
+_CONTEXT_SECTIONS = "\n".join([
+    "## Overview",
+    "[Provide a high-level overview of this context area]",
+    "",
+    "## Key Information",
+    "- [Key point 1]",
+    "- [Key point 2]",
+    "- [Key point 3]",
+    "",
+    "## Stakeholders",
+    "- [Stakeholder 1]: [Role/Responsibility]",
+    "- [Stakeholder 2]: [Role/Responsibility]",
+    "",
+    "## Impact",
+    "[Describe the impact and importance of this context]",
+])
+
+_TECH_SPECS_SECTIONS = "\n".join([
+    "## Technical Overview",
+    "[Provide technical overview and purpose]",
+    "",
+    "## Architecture",
+    "[Describe the architecture and design]",
+    "",
+    "## Implementation Details",
+    "### Components",
+    "- [Component 1]: [Description]",
+    "- [Component 2]: [Description]",
+    "",
+    "### Dependencies",
+    "- [Dependency 1]: [Version/Purpose]",
+    "- [Dependency 2]: [Version/Purpose]",
+    "",
+    "## Configuration",
+    "[Configuration details and settings]",
+    "",
+    "## API/Interface",
+    "[API endpoints, interfaces, or usage patterns]",
+])
+
+_DEVOPS_SECTIONS = "\n".join([
+    "## Purpose",
+    "[Describe the DevOps purpose and goals]",
+    "",
+    "## Infrastructure",
+    "[Infrastructure components and setup]",
+    "",
+    "## Deployment Process",
+    "1. [Step 1]",
+    "2. [Step 2]",
+    "3. [Step 3]",
+    "4. [Step 4]",
+    "",
+    "## Monitoring",
+    "[Monitoring setup and metrics]",
+    "",
+    "## Troubleshooting",
+    "[Common issues and solutions]",
+    "",
+    "## Maintenance",
+    "[Maintenance procedures and schedules]",
+])
+
+_DEFAULT_SECTIONS = "\n".join([
+    "## Overview",
+    "[Provide an overview of this topic]",
+    "",
+    "## Details",
+    "[Detailed information and specifications]",
+    "",
+    "## Usage",
+    "[How to use or implement this]",
+    "",
+    "## Examples",
+    "[Provide relevant examples]",
+    "",
+    "## Notes",
+    "[Additional notes and considerations]",
+])
+
+_SECTIONS_BY_CATEGORY = {
+    'context': _CONTEXT_SECTIONS,
+    'tech_specs': _TECH_SPECS_SECTIONS,
+    'devops': _DEVOPS_SECTIONS,
 }
 
+
+@functools.lru_cache(maxsize=1024)
+def _path_words(path: str) -> frozenset:
+    """Return the lowercased words of a file path, splitting on '/' and '_'."""
+    return frozenset(path.lower().replace('/', ' ').replace('_', ' ').split())
+
+
+@functools.lru_cache(maxsize=32)
+def _template_skeleton(file_name: str) -> tuple:
+    """
+    Return (title, description, sections) for a template file name.
+
+    The skeleton depends only on the file name, so it is derived once per name;
+    the timestamped frontmatter and change history are filled in per call.
+    """
+    # Extract title from file name
+    title = Path(file_name).stem.replace('_', ' ').title()
+    
+    # Generate description based on path
+    path_parts = Path(file_name).parts
+    if 'context' in path_parts:
+        description = f"Context information for {title.lower()}"
+    elif 'tech_specs' in path_parts:
+        description = f"Technical specifications for {title.lower()}"
+    elif 'devops' in path_parts:
+        description = f"DevOps and operational information for {title.lower()}"
+    elif 'dynamic_meta' in path_parts:
+        description = f"Dynamic metadata for {title.lower()}"
+    else:
+        description = f"Documentation for {title.lower()}"
+    
+    # Pick content sections based on category
+    sections = next(
+        (sections for category, sections in _SECTIONS_BY_CATEGORY.items() if category in path_parts),
+        _DEFAULT_SECTIONS
+    )
+    
+    return title, description, sections
+
+
 @mcp.tool()
 def get_memory_bank_structure() -> str:
     """
@@ -85,83 +580,55 @@ def get_memory_bank_structure() -> str:
     Returns:
         str: A formatted string showing the memory bank directory structure
     """
-    def setup_logging():
-        """Setup logging for this tool"""
-        memory_bank_path = Path("memory-bank")
-        memory_bank_path.mkdir(exist_ok=True)
-        
-        log_file = memory_bank_path / "Logs.log"
-        handler = logging.handlers.RotatingFileHandler(
-            log_file, maxBytes=1024*1024, backupCount=1
-        )
-        formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(funcName)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger = logging.getLogger('memory_bank_structure')
-        logger.setLevel(logging.INFO)
-        logger.addHandler(handler)
-        return logger
-    
-    def get_contributor_id():
-        """Get contributor ID from environment or git"""
-        contributor_id = None
-        for env_var in ["GIT_AUTHOR_NAME", "USER", "USERNAME"]:
-            value = os.environ.get(env_var)
-            if value:
-                contributor_id = value.strip()
-                break
-        
-        if not contributor_id:
-            try:
-                result = subprocess.run(
-                    ["git", "config", "user.name"], 
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    contributor_id = result.stdout.strip()
-            except:
-                pass
-        
-        if not contributor_id:
-            try:
-                contributor_id = f"user-{socket.gethostname()}"
-            except:
-                contributor_id = "unknown-user"
-        
-        return contributor_id
-    
-    def build_tree_structure(path, max_depth=4, current_depth=0):
-        """Build tree structure recursively"""
+    def build_tree_structure(path, max_depth=4):
+        """Build tree structure and count every entry in a single scandir walk"""
         items = []
-        if current_depth >= max_depth:
-            return items
+        entry_count = 0
         
-        try:
-            for item in sorted(path.iterdir()):
-                if item.name.startswith('.'):
-                    continue
-                
-                indent = "  " * current_depth
-                if item.is_dir():
-                    items.append(f"{indent}📁 {item.name}/")
-                    items.extend(build_tree_structure(item, max_depth, current_depth + 1))
-                else:
-                    items.append(f"{indent}📄 {item.name}")
-        except PermissionError:
+        def walk(dir_path, current_depth, show, count):
+            nonlocal entry_count
+            if not show and not count:
+                return
+            
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = sorted(it, key=lambda entry: os.path.normcase(entry.name))
+            except PermissionError:
+                if show:
+                    indent = "  " * current_depth
+                    items.append(f"{indent}❌ Permission denied")
+                return
+            
             indent = "  " * current_depth
-            items.append(f"{indent}❌ Permission denied")
+            for entry in entries:
+                if count:
+                    entry_count += 1
+                
+                shown = show and not entry.name.startswith('.')
+                is_dir = entry.is_dir()
+                if shown:
+                    items.append(f"{indent}📁 {entry.name}/" if is_dir else f"{indent}📄 {entry.name}")
+                
+                # Hidden and deeper entries are still counted; like rglob, the
+                # count does not descend into symlinked directories.
+                if is_dir:
+                    walk(
+                        entry.path,
+                        current_depth + 1,
+                        shown and current_depth + 1 < max_depth,
+                        count and not entry.is_symlink(),
+                    )
         
-        return items
+        walk(path, 0, max_depth > 0, True)
+        return items, entry_count
     
     # Setup
-    logger = setup_logging()
-    contributor_id = get_contributor_id()
-    memory_bank_path = Path("memory-bank")
-    timestamp = f"{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')} [{contributor_id}]"
+    contributor_id = _resolve_contributor_id()
+    memory_bank_path = _ensure_memory_bank()
+    timestamp = f"{_utc_timestamp()} [{contributor_id}]"
     
     # Log the operation
-    logger.info(f"🔍 Memory bank structure requested by {contributor_id}")
+    _logger.info(f"🔍 Memory bank structure requested by {contributor_id}")
     
     # Build structure
     if not memory_bank_path.exists():
@@ -173,7 +640,7 @@ The memory-bank directory doesn't exist yet.
 Use 'create_memory_bank_structure' to initialize it.
 """
     
-    structure_items = build_tree_structure(memory_bank_path)
+    structure_items, entry_count = build_tree_structure(memory_bank_path)
     structure = "\n".join(structure_items)
     
     if not structure:
@@ -191,7 +658,7 @@ Generated: {timestamp}
 
 {structure}
 
-Total files: {len(list(memory_bank_path.rglob('*'))) if memory_bank_path.exists() else 0}
+Total files: {entry_count}
 """
 
 @mcp.tool()
@@ -202,66 +669,25 @@ def create_memory_bank_structure() -> str:
     Returns:
         str: Success message with created structure details
     """
-    def setup_logging():
-        """Setup logging for this tool"""
-        memory_bank_path = Path("memory-bank")
-        memory_bank_path.mkdir(exist_ok=True)
-        
-        log_file = memory_bank_path / "Logs.log"
-        handler = logging.handlers.RotatingFileHandler(
-            log_file, maxBytes=1024*1024, backupCount=1
-        )
-        formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(funcName)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger = logging.getLogger('memory_bank_create')
-        logger.setLevel(logging.INFO)
-        logger.addHandler(handler)
-        return logger
-    
-    def get_contributor_id():
-        """Get contributor ID from environment or git"""
-        contributor_id = None
-        for env_var in ["GIT_AUTHOR_NAME", "USER", "USERNAME"]:
-            value = os.environ.get(env_var)
-            if value:
-                contributor_id = value.strip()
-                break
-        
-        if not contributor_id:
-            try:
-                result = subprocess.run(
-                    ["git", "config", "user.name"], 
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    contributor_id = result.stdout.strip()
-            except:
-                pass
-        
-        if not contributor_id:
-            try:
-                contributor_id = f"user-{socket.gethostname()}"
-            except:
-                contributor_id = "unknown-user"
-        
-        return contributor_id
-    
-    def create_template_with_metadata(template_content, timestamp, contributor_id):
-        """Add metadata to template content"""
+    def create_template_with_metadata(template_name, timestamp, contributor_id):
+        """Add metadata to template content, returning the encoded file bytes"""
+        template_content = _load_template(template_name)
         # Extract title from template if it exists
         if "title:" in template_content:
-            return template_content.replace(
-                "last_updated: [timestamp]", 
-                f"last_updated: {timestamp}"
-            ).replace(
-                "created_by: [contributor]",
-                f"created_by: {contributor_id}"
-            )
+            # Most templates carry no placeholders; their bytes are reused as is
+            if _TEMPLATE_PLACEHOLDER_PATTERN.search(template_content) is None:
+                return _load_template_bytes(template_name)
+            replacements = {
+                "last_updated: [timestamp]": f"last_updated: {timestamp}",
+                "created_by: [contributor]": f"created_by: {contributor_id}",
+            }
+            return _encode_for_write(_TEMPLATE_PLACEHOLDER_PATTERN.sub(
+                lambda match: replacements.get(match.group(0), match.group(0)),
+                template_content
+            ))
         else:
-            # Add basic metadata header
-            return f"""---
+            # Add basic metadata header; only the header is encoded per call
+            return _encode_for_write(f"""---
 title: Generated Template
 description: Auto-generated template file
 last_updated: {timestamp}
@@ -269,16 +695,15 @@ created_by: {contributor_id}
 version: 1.0
 ---
 
-{template_content}"""
+""") + _load_template_bytes(template_name)
     
     # Setup
-    logger = setup_logging()
-    contributor_id = get_contributor_id()
-    memory_bank_path = Path("memory-bank")
-    timestamp = f"{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')} [{contributor_id}]"
+    contributor_id = _resolve_contributor_id()
+    memory_bank_path = _ensure_memory_bank()
+    timestamp = f"{_utc_timestamp()} [{contributor_id}]"
     
     # Log the operation
-    logger.info(f"🏗️ Memory bank structure creation initiated by {contributor_id}")
+    _logger.info(f"🏗️ Memory bank structure creation initiated by {contributor_id}")
     
     # Define directory structure
     directories = [
@@ -291,39 +716,39 @@ version: 1.0
     
     # Define template files using imported templates
     templates = {
-        "memory_bank_instructions.md": create_template_with_metadata(MEMORY_BANK_INSTRUCTIONS, timestamp, contributor_id),
-        "context/overview.md": create_template_with_metadata(OVERVIEW_TEMPLATE, timestamp, contributor_id),
-        "context/stakeholders.md": create_template_with_metadata(STAKEHOLDERS_TEMPLATE, timestamp, contributor_id),
-        "context/success_metrics.md": create_template_with_metadata(SUCCESS_METRICS_TEMPLATE, timestamp, contributor_id),
-        "tech_specs/system_architecture.md": create_template_with_metadata(SYSTEM_ARCHITECTURE_TEMPLATE, timestamp, contributor_id),
-        "tech_specs/data_flow.md": create_template_with_metadata(DATA_FLOW_TEMPLATE, timestamp, contributor_id),
-        "tech_specs/api_reference.md": create_template_with_metadata(API_REFERENCE_TEMPLATE, timestamp, contributor_id),
-        "devops/deployment_architecture.md": create_template_with_metadata(DEPLOYMENT_ARCHITECTURE_TEMPLATE, timestamp, contributor_id),
-        "devops/ci_cd_pipeline.md": create_template_with_metadata(CI_CD_PIPELINE_TEMPLATE, timestamp, contributor_id),
-        "dynamic_meta/change_log.md": create_template_with_metadata(CHANGE_LOG_TEMPLATE, timestamp, contributor_id),
-        "dynamic_meta/decision_logs.md": create_template_with_metadata(DECISION_LOGS_TEMPLATE, timestamp, contributor_id),
-        "dynamic_meta/config_map.md": create_template_with_metadata(CONFIG_MAP_TEMPLATE, timestamp, contributor_id),
+        "memory_bank_instructions.md": create_template_with_metadata("memory_bank_instructions.md", timestamp, contributor_id),
+        "context/overview.md": create_template_with_metadata("overview.md", timestamp, contributor_id),
+        "context/stakeholders.md": create_template_with_metadata("stakeholders.md", timestamp, contributor_id),
+        "context/success_metrics.md": create_template_with_metadata("success_metrics.md", timestamp, contributor_id),
+        "tech_specs/system_architecture.md": create_template_with_metadata("system_architecture.md", timestamp, contributor_id),
+        "tech_specs/data_flow.md": create_template_with_metadata("data_flow.md", timestamp, contributor_id),
+        "tech_specs/api_reference.md": create_template_with_metadata("api_reference.md", timestamp, contributor_id),
+        "devops/deployment_architecture.md": create_template_with_metadata("deployment_architecture.md", timestamp, contributor_id),
+        "devops/ci_cd_pipeline.md": create_template_with_metadata("ci_cd_pipeline.md", timestamp, contributor_id),
+        "dynamic_meta/change_log.md": create_template_with_metadata("change_log.md", timestamp, contributor_id),
+        "dynamic_meta/decision_logs.md": create_template_with_metadata("decision_logs.md", timestamp, contributor_id),
+        "dynamic_meta/config_map.md": create_template_with_metadata("config_map.md", timestamp, contributor_id),
     }
     
-    # Create directories
-    created_dirs = []
-    for directory in directories:
-        dir_path = memory_bank_path / directory
+    # Create directories, each one once; parents sort ahead of their children
+    # so every mkdir finds its parent already in place
+    created_dirs = list(directories)
+    pending_writes = {memory_bank_path / file_path: content for file_path, content in templates.items()}
+    all_dirs = {memory_bank_path / directory for directory in directories}
+    all_dirs.update(full_path.parent for full_path in pending_writes)
+    all_dirs.discard(memory_bank_path)
+    for dir_path in sorted(all_dirs, key=lambda path: len(path.parts)):
         dir_path.mkdir(parents=True, exist_ok=True)
-        created_dirs.append(directory)
     
     # Create template files
-    created_files = []
-    for file_path, content in templates.items():
-        full_path = memory_bank_path / file_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content, encoding='utf-8')
-        created_files.append(file_path)
+    created_files = list(templates)
+    for full_path, content in pending_writes.items():
+        full_path.write_bytes(content)
     
     # Log successful creation
-    logger.info(f"✅ Memory bank structure created successfully by {contributor_id}")
-    logger.info(f"📁 Created {len(created_dirs)} directories: {', '.join(created_dirs)}")
-    logger.info(f"📄 Created {len(created_files)} template files")
+    _logger.info(f"✅ Memory bank structure created successfully by {contributor_id}")
+    _logger.info(f"📁 Created {len(created_dirs)} directories: {', '.join(created_dirs)}")
+    _logger.info(f"📄 Created {len(created_files)} template files")
     
     return f"""
 ✅ Memory Bank Structure Created Successfully!
@@ -350,7 +775,7 @@ The memory bank is now ready for use! 🚀
 """
 
 @mcp.tool() 
-def intelligent_context_executor(user_query: str = "") -> str:
+async def intelligent_context_executor(user_query: str = "") -> str:
     """
     Intelligent context executor that provides comprehensive project context.
     
@@ -360,90 +785,61 @@ def intelligent_context_executor(user_query: str = "") -> str:
     Returns:
         str: Comprehensive context response with relevant files and tool suggestions
     """
-    def setup_logging():
-        """Setup logging for this tool"""
-        memory_bank_path = Path("memory-bank")
-        memory_bank_path.mkdir(exist_ok=True)
-        
-        log_file = memory_bank_path / "Logs.log"
-        handler = logging.handlers.RotatingFileHandler(
-            log_file, maxBytes=1024*1024, backupCount=1
-        )
-        formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(funcName)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger = logging.getLogger('memory_bank_context')
-        logger.setLevel(logging.INFO)
-        logger.addHandler(handler)
-        return logger
-    
-    def get_contributor_id():
-        """Get contributor ID from environment or git"""
-        contributor_id = None
-        for env_var in ["GIT_AUTHOR_NAME", "USER", "USERNAME"]:
-            value = os.environ.get(env_var)
-            if value:
-                contributor_id = value.strip()
-                break
-        
-        if not contributor_id:
-            try:
-                result = subprocess.run(
-                    ["git", "config", "user.name"], 
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    contributor_id = result.stdout.strip()
-            except:
-                pass
-        
-        if not contributor_id:
-            try:
-                contributor_id = f"user-{socket.gethostname()}"
-            except:
-                contributor_id = "unknown-user"
-        
-        return contributor_id
-    
     def extract_content_without_yaml(file_path, line_count=20):
         """Extract content from file, skipping YAML frontmatter"""
         try:
-            content = file_path.read_text(encoding='utf-8')
-            lines = content.split('\n')
-            
-            # Find YAML frontmatter end marker
-            yaml_end = 0
-            if lines and lines[0].strip().startswith('---'):
-                for i, line in enumerate(lines[1:], 1):
-                    if line.strip() == '---':
-                        yaml_end = i + 1
-                        break
-            
-            # Extract only content, skip YAML frontmatter
-            content_lines = lines[yaml_end:yaml_end+line_count]
-            return '\n'.join(content_lines)
-        except Exception as e:
+            return skip_yaml_frontmatter(_read_memory_file(file_path), line_count)
+        except (OSError, UnicodeDecodeError) as e:
             return f"Error reading file: {str(e)}"
     
-    def calculate_relevance_score(file_path, query_words):
+    def skip_yaml_frontmatter(content, line_count):
+        """Return the first line_count lines of content after any YAML frontmatter"""
+        # Find YAML frontmatter end marker by walking line offsets, so only
+        # the frontmatter is scanned rather than splitting the whole file
+        start = 0
+        line_end = content.find('\n')
+        if line_end != -1 and content[:line_end].strip().startswith('---'):
+            while line_end != -1:
+                line_start = line_end + 1
+                line_end = content.find('\n', line_start)
+                line = content[line_start:] if line_end == -1 else content[line_start:line_end]
+                if line.strip() == '---':
+                    start = len(content) if line_end == -1 else line_end + 1
+                    break
+        
+        # Extract only content, skip YAML frontmatter
+        end = start
+        search_from = start
+        for _ in range(line_count):
+            newline = content.find('\n', search_from)
+            if newline == -1:
+                end = len(content)
+                break
+            end = newline
+            search_from = newline + 1
+        return content[start:end]
+    
+    def read_mandatory_file(memory_bank_path, file_path):
+        """Read one mandatory file's context, or record that it is missing"""
+        full_path = memory_bank_path / file_path
+        if full_path.exists():
+            content = extract_content_without_yaml(full_path, 20)
+            return {"path": file_path, "content": content}
+        return {"path": file_path, "error": "File not found"}
+    
+    def calculate_relevance_score(file_path, content, query_words):
         """Calculate relevance score for a file based on query"""
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            
-            score = 0.0
-            
-            # Score based on path relevance
-            path_words = set(str(file_path).lower().replace('/', ' ').replace('_', ' ').split())
-            score += len(query_words.intersection(path_words)) * 2
-            
-            # Score based on content relevance (first 300 chars)
-            content_words = set(content.lower()[:300].split())
-            score += len(query_words.intersection(content_words))
-            
-            return score
-        except Exception:
-            return 0.0
+        score = 0.0
+        
+        # Score based on path relevance
+        path_words = _path_words(str(file_path))
+        score += len(query_words.intersection(path_words)) * 2
+        
+        # Score based on content relevance (first 300 chars)
+        content_words = set(content.lower()[:300].split())
+        score += len(query_words.intersection(content_words))
+        
+        return score
     
     def get_relevant_files(memory_bank_path, user_query, mandatory_files, max_files=3):
         """Get relevant files based on query"""
@@ -458,9 +854,14 @@ def intelligent_context_executor(user_query: str = "") -> str:
             if md_file.is_file():
                 relative_path = str(md_file.relative_to(memory_bank_path))
                 if relative_path not in mandatory_file_set:
-                    score = calculate_relevance_score(md_file, query_words)
+                    # One read feeds both the score and the preview
+                    try:
+                        file_content = _read_memory_file(md_file)
+                    except (OSError, UnicodeDecodeError):
+                        continue
+                    score = calculate_relevance_score(md_file, file_content, query_words)
                     if score > 0:
-                        content = extract_content_without_yaml(md_file, 15)
+                        content = skip_yaml_frontmatter(file_content, 15)
                         scored_files.append((relative_path, content, score))
         
         # Sort by score and get top files
@@ -469,23 +870,11 @@ def intelligent_context_executor(user_query: str = "") -> str:
     
     def generate_tool_suggestions(user_query):
         """Generate tool suggestions based on query"""
-        tool_suggestions = []
-        query_lower = user_query.lower()
-        
-        if any(word in query_lower for word in ['create', 'generate', 'template', 'new']):
-            tool_suggestions.append("🛠️ generate_memory_bank_template - Create new template files")
-        
-        if any(word in query_lower for word in ['analyze', 'summary', 'overview']):
-            tool_suggestions.append("🛠️ analyze_project_summary - Analyze project information")
-        
-        if any(word in query_lower for word in ['update', 'modify', 'change', 'edit']):
-            tool_suggestions.append("🛠️ suggest_files_to_update - Get file update suggestions")
-        
-        if any(word in query_lower for word in ['route', 'organize', 'structure']):
-            tool_suggestions.append("🛠️ smart_project_analysis_and_routing - Analyze and route content")
-        
-        if any(word in query_lower for word in ['detect', 'changes', 'diff']):
-            tool_suggestions.append("🛠️ auto_detect_project_changes - Detect project changes")
+        query_tokens = frozenset(_WORD_PATTERN.findall(user_query.lower()))
+        tool_suggestions = [
+            suggestion for keywords, suggestion in _TOOL_SUGGESTION_RULES
+            if not keywords.isdisjoint(query_tokens)
+        ]
         
         # Default suggestions if no specific matches
         if not tool_suggestions:
@@ -499,13 +888,12 @@ def intelligent_context_executor(user_query: str = "") -> str:
         return tool_suggestions
     
     # Setup
-    logger = setup_logging()
-    contributor_id = get_contributor_id()
-    memory_bank_path = Path("memory-bank")
-    timestamp = f"{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')} [{contributor_id}]"
+    contributor_id = _resolve_contributor_id()
+    memory_bank_path = _ensure_memory_bank()
+    timestamp = f"{_utc_timestamp()} [{contributor_id}]"
     
     # Log the operation
-    logger.info(f"🧠 Context execution requested by {contributor_id}: {user_query[:100]}...")
+    _logger.info(f"🧠 Context execution requested by {contributor_id}: {user_query[:100]}...")
     
     # Check if memory bank exists
     if not memory_bank_path.exists():
@@ -520,18 +908,13 @@ Timestamp: {timestamp}
     
     # Extract context from mandatory files
     mandatory_files = ["context/overview.md", "dynamic_meta/change_log.md", "dynamic_meta/decision_logs.md"]
-    mandatory_context = []
-    
-    for file_path in mandatory_files:
-        full_path = memory_bank_path / file_path
-        if full_path.exists():
-            content = extract_content_without_yaml(full_path, 20)
-            mandatory_context.append({"path": file_path, "content": content})
-        else:
-            mandatory_context.append({"path": file_path, "error": "File not found"})
     
-    # Get additional relevant files based on query
-    relevant_files = get_relevant_files(memory_bank_path, user_query, mandatory_files)
+    # Read the mandatory files and get additional relevant files based on
+    # query concurrently, off the event loop
+    *mandatory_context, relevant_files = await asyncio.gather(
+        *(asyncio.to_thread(read_mandatory_file, memory_bank_path, file_path) for file_path in mandatory_files),
+        asyncio.to_thread(get_relevant_files, memory_bank_path, user_query, mandatory_files)
+    )
     
     # Build context response
     context_sections = []
@@ -561,7 +944,7 @@ Timestamp: {timestamp}
     tool_suggestions = generate_tool_suggestions(user_query)
     
     # Log successful context execution
-    logger.info(f"✅ Context executed successfully for query: {user_query[:50]}...")
+    _logger.info(f"✅ Context executed successfully for query: {user_query[:50]}...")
     
     return f"""
 🧠 Intelligent Context Executor
@@ -598,49 +981,13 @@ def generate_memory_bank_template(file_name: str = "") -> str:
     Returns:
         str: Success message with template details
     """
-    # Embedded logging setup
-    memory_bank_path = Path("memory-bank")
-    memory_bank_path.mkdir(exist_ok=True)
-    
-    log_file = memory_bank_path / "Logs.log"
-    handler = logging.handlers.RotatingFileHandler(
-        log_file, maxBytes=1024*1024, backupCount=1
-    )
-    formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(funcName)s - %(message)s'
-    )
-    handler.setFormatter(formatter)
-    logger = logging.getLogger('memory_bank_template')
-    logger.setLevel(logging.INFO)
-    logger.addHandler(handler)
+    memory_bank_path = _ensure_memory_bank()
     
     # Get contributor ID
-    contributor_id = None
-    for env_var in ["GIT_AUTHOR_NAME", "USER", "USERNAME"]:
-        value = os.environ.get(env_var)
-        if value:
-            contributor_id = value.strip()
-            break
-    
-    if not contributor_id:
-        try:
-            result = subprocess.run(
-                ["git", "config", "user.name"], 
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                contributor_id = result.stdout.strip()
-        except:
-            pass
-    
-    if not contributor_id:
-        try:
-            contributor_id = f"user-{socket.gethostname()}"
-        except:
-            contributor_id = "unknown-user"
+    contributor_id = _resolve_contributor_id()
     
     # Generate timestamp
-    timestamp = f"{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')} [{contributor_id}]"
+    timestamp = f"{_utc_timestamp()} [{contributor_id}]"
     
     if not file_name:
         return f"""
@@ -657,7 +1004,7 @@ Timestamp: {timestamp}
 """
     
     # Log the operation
-    logger.info(f"📝 Template generation requested by {contributor_id}: {file_name}")
+    _logger.info(f"📝 Template generation requested by {contributor_id}: {file_name}")
     
     # Ensure .md extension
     if not file_name.endswith('.md'):
@@ -678,106 +1025,8 @@ Existing file path: {full_path}
 Timestamp: {timestamp}
 """
     
-    # Generate template content based on file path - inline logic
-    # Extract title from file name
-    title = Path(file_name).stem.replace('_', ' ').title()
-    
-    # Generate description based on path
-    path_parts = Path(file_name).parts
-    if 'context' in path_parts:
-        description = f"Context information for {title.lower()}"
-    elif 'tech_specs' in path_parts:
-        description = f"Technical specifications for {title.lower()}"
-    elif 'devops' in path_parts:
-        description = f"DevOps and operational information for {title.lower()}"
-    elif 'dynamic_meta' in path_parts:
-        description = f"Dynamic metadata for {title.lower()}"
-    else:
-        description = f"Documentation for {title.lower()}"
-    
-    # Generate content sections based on category
-    content_sections = []
-    
-    if 'context' in path_parts:
-        content_sections = [
-            "## Overview",
-            "[Provide a high-level overview of this context area]",
-            "",
-            "## Key Information",
-            "- [Key point 1]",
-            "- [Key point 2]",
-            "- [Key point 3]",
-            "",
-            "## Stakeholders",
-            "- [Stakeholder 1]: [Role/Responsibility]",
-            "- [Stakeholder 2]: [Role/Responsibility]",
-            "",
-            "## Impact",
-            "[Describe the impact and importance of this context]"
-        ]
-    elif 'tech_specs' in path_parts:
-        content_sections = [
-            "## Technical Overview",
-            "[Provide technical overview and purpose]",
-            "",
-            "## Architecture",
-            "[Describe the architecture and design]",
-            "",
-            "## Implementation Details",
-            "### Components",
-            "- [Component 1]: [Description]",
-            "- [Component 2]: [Description]",
-            "",
-            "### Dependencies",
-            "- [Dependency 1]: [Version/Purpose]",
-            "- [Dependency 2]: [Version/Purpose]",
-            "",
-            "## Configuration",
-            "[Configuration details and settings]",
-            "",
-            "## API/Interface",
-            "[API endpoints, interfaces, or usage patterns]"
-        ]
-    elif 'devops' in path_parts:
-        content_sections = [
-            "## Purpose",
-            "[Describe the DevOps purpose and goals]",
-            "",
-            "## Infrastructure",
-            "[Infrastructure components and setup]",
-            "",
-            "## Deployment Process",
-            "1. [Step 1]",
-            "2. [Step 2]",
-            "3. [Step 3]",
-            "4. [Step 4]",
-            "",
-            "## Monitoring",
-            "[Monitoring setup and metrics]",
-            "",
-            "## Troubleshooting",
-            "[Common issues and solutions]",
-            "",
-            "## Maintenance",
-            "[Maintenance procedures and schedules]"
-        ]
-    else:
-        content_sections = [
-            "## Overview",
-            "[Provide an overview of this topic]",
-            "",
-            "## Details",
-            "[Detailed information and specifications]",
-            "",
-            "## Usage",
-            "[How to use or implement this]",
-            "",
-            "## Examples",
-            "[Provide relevant examples]",
-            "",
-            "## Notes",
-            "[Additional notes and considerations]"
-        ]
+    # Generate template content based on file path
+    title, description, sections = _template_skeleton(file_name)
     
     # Build complete template
     template_content = f"""---
@@ -789,7 +1038,7 @@ version: 1.0
 
 # {title}
 
-{chr(10).join(content_sections)}
+{sections}
 
 ## Change History
 - **{timestamp}**: Initial template created by {contributor_id}
@@ -804,7 +1053,7 @@ version: 1.0
         full_path.write_text(template_content, encoding='utf-8')
         
         # Log successful creation
-        logger.info(f"✅ Template created successfully: {file_name}")
+        _logger.info(f"✅ Template created successfully: {file_name}")
         
         return f"""
 ✅ Template Created Successfully!
@@ -830,7 +1079,7 @@ The template is ready for customization! ✨
 """
     
     except Exception as e:
-        logger.error(f"❌ Template creation failed: {str(e)}")
+        _logger.error(f"❌ Template creation failed: {str(e)}")
         return f"""
 ❌ Template Creation Failed
 
@@ -857,49 +1106,13 @@ def analyze_project_summary(project_summary: str = "") -> str:
     Returns:
         str: Structured analysis with insights and recommendations
     """
-    # Embedded logging setup
-    memory_bank_path = Path("memory-bank")
-    memory_bank_path.mkdir(exist_ok=True)
-    
-    log_file = memory_bank_path / "Logs.log"
-    handler = logging.handlers.RotatingFileHandler(
-        log_file, maxBytes=1024*1024, backupCount=1
-    )
-    formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(funcName)s - %(message)s'
-    )
-    handler.setFormatter(formatter)
-    logger = logging.getLogger('memory_bank_analyze')
-    logger.setLevel(logging.INFO)
-    logger.addHandler(handler)
+    memory_bank_path = _ensure_memory_bank()
     
     # Get contributor ID
-    contributor_id = None
-    for env_var in ["GIT_AUTHOR_NAME", "USER", "USERNAME"]:
-        value = os.environ.get(env_var)
-        if value:
-            contributor_id = value.strip()
-            break
-    
-    if not contributor_id:
-        try:
-            result = subprocess.run(
-                ["git", "config", "user.name"], 
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                contributor_id = result.stdout.strip()
-        except:
-            pass
-    
-    if not contributor_id:
-        try:
-            contributor_id = f"user-{socket.gethostname()}"
-        except:
-            contributor_id = "unknown-user"
+    contributor_id = _resolve_contributor_id()
     
     # Generate timestamp
-    timestamp = f"{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')} [{contributor_id}]"
+    timestamp = f"{_utc_timestamp()} [{contributor_id}]"
     
     if not project_summary:
         return f"""
@@ -916,117 +1129,49 @@ Timestamp: {timestamp}
 """
     
     # Log the operation
-    logger.info(f"📊 Project analysis requested by {contributor_id}: {project_summary[:100]}...")
+    _logger.info(f"📊 Project analysis requested by {contributor_id}: {project_summary[:100]}...")
     
     # Analyze project summary - inline logic
-    # Extract keywords
-    tech_keywords_list = [
-        'api', 'database', 'frontend', 'backend', 'server', 'client',
-        'authentication', 'authorization', 'security', 'deployment',
-        'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'cloud',
-        'microservices', 'monolith', 'rest', 'graphql', 'websocket',
-        'react', 'vue', 'angular', 'node', 'python', 'java', 'go',
-        'mongodb', 'postgresql', 'mysql', 'redis', 'elasticsearch',
-        'machine learning', 'ai', 'analytics', 'monitoring', 'logging'
-    ]
-    
-    business_keywords_list = [
-        'user', 'customer', 'business', 'revenue', 'profit', 'cost',
-        'market', 'competition', 'strategy', 'growth', 'scalability',
-        'performance', 'efficiency', 'productivity', 'automation',
-        'integration', 'workflow', 'process', 'optimization'
-    ]
-    
+    # Check every distinct keyword once; the rules below are set lookups
     text_lower = project_summary.lower()
-    tech_keywords = [kw for kw in tech_keywords_list if kw in text_lower]
-    business_keywords = [kw for kw in business_keywords_list if kw in text_lower]
+    keyword_hits = {kw for kw in _SUMMARY_KEYWORDS if kw in text_lower}
+    
+    # Extract keywords
+    tech_keywords = [kw for kw in _SUMMARY_TECH_KEYWORDS if kw in keyword_hits]
+    business_keywords = [kw for kw in _SUMMARY_BUSINESS_KEYWORDS if kw in keyword_hits]
     
     # Identify project type
-    if any(word in text_lower for word in ['web app', 'website', 'frontend', 'ui', 'ux']):
-        project_type = "Web Application"
-    elif any(word in text_lower for word in ['api', 'backend', 'server', 'microservice']):
-        project_type = "Backend Service"
-    elif any(word in text_lower for word in ['mobile', 'ios', 'android', 'app']):
-        project_type = "Mobile Application"
-    elif any(word in text_lower for word in ['data', 'analytics', 'machine learning', 'ai']):
-        project_type = "Data/Analytics Platform"
-    elif any(word in text_lower for word in ['devops', 'infrastructure', 'deployment']):
-        project_type = "DevOps/Infrastructure"
-    elif any(word in text_lower for word in ['game', 'gaming', 'entertainment']):
-        project_type = "Gaming/Entertainment"
-    else:
-        project_type = "General Software Project"
+    project_type = next(
+        (label for words, label in _SUMMARY_PROJECT_TYPES if not keyword_hits.isdisjoint(words)),
+        "General Software Project"
+    )
     
     # Suggest architecture patterns
-    architecture_patterns = []
-    
-    if any(word in text_lower for word in ['microservice', 'distributed', 'scalable']):
-        architecture_patterns.append("Microservices Architecture")
-    
-    if any(word in text_lower for word in ['event', 'message', 'queue', 'async']):
-        architecture_patterns.append("Event-Driven Architecture")
-    
-    if any(word in text_lower for word in ['api', 'rest', 'graphql']):
-        architecture_patterns.append("API-First Architecture")
-    
-    if any(word in text_lower for word in ['layer', 'tier', 'separation']):
-        architecture_patterns.append("Layered Architecture")
-    
-    if any(word in text_lower for word in ['serverless', 'lambda', 'function']):
-        architecture_patterns.append("Serverless Architecture")
+    architecture_patterns = [
+        pattern for words, pattern in _SUMMARY_ARCHITECTURE_PATTERNS
+        if not keyword_hits.isdisjoint(words)
+    ]
     
     if not architecture_patterns:
         architecture_patterns.append("Monolithic Architecture")
     
     # Identify technology stack
     tech_stack = {
-        'frontend': [],
-        'backend': [],
-        'database': [],
-        'infrastructure': [],
-        'tools': []
+        category: [tech for tech in techs if tech in keyword_hits]
+        for category, techs in _SUMMARY_TECH_STACK.items()
     }
     
-    # Frontend technologies
-    frontend_techs = ['react', 'vue', 'angular', 'svelte', 'html', 'css', 'javascript', 'typescript']
-    tech_stack['frontend'] = [tech for tech in frontend_techs if tech in text_lower]
-    
-    # Backend technologies
-    backend_techs = ['node', 'python', 'java', 'go', 'php', 'ruby', 'c#', 'scala']
-    tech_stack['backend'] = [tech for tech in backend_techs if tech in text_lower]
-    
-    # Database technologies
-    db_techs = ['postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'sqlite']
-    tech_stack['database'] = [tech for tech in db_techs if tech in text_lower]
-    
-    # Infrastructure
-    infra_techs = ['docker', 'kubernetes', 'aws', 'azure', 'gcp', 'heroku', 'netlify']
-    tech_stack['infrastructure'] = [tech for tech in infra_techs if tech in text_lower]
-    
-    # Tools
-    tool_techs = ['git', 'jenkins', 'github', 'gitlab', 'jira', 'slack']
-    tech_stack['tools'] = [tech for tech in tool_techs if tech in text_lower]
-    
     # Generate recommendations
-    recommendations = []
-    
-    if 'security' in tech_keywords:
-        recommendations.append("🔒 Implement comprehensive security measures including authentication, authorization, and data encryption")
-    
-    if 'scalability' in business_keywords:
-        recommendations.append("📈 Design for horizontal scaling with load balancing and distributed architecture")
-    
-    if 'performance' in business_keywords:
-        recommendations.append("⚡ Implement caching strategies and performance monitoring")
-    
-    if 'api' in tech_keywords:
-        recommendations.append("🔌 Design RESTful APIs with proper versioning and documentation")
+    recommendations = [
+        recommendation for keyword, recommendation in _SUMMARY_RECOMMENDATIONS
+        if keyword in keyword_hits
+    ]
     
     if not recommendations:
         recommendations.append("📋 Consider implementing proper logging, monitoring, and testing strategies")
     
     # Log successful analysis
-    logger.info(f"✅ Project analysis completed for {contributor_id}")
+    _logger.info(f"✅ Project analysis completed for {contributor_id}")
     
     return f"""
 📊 Project Analysis Report
@@ -1083,49 +1228,13 @@ def suggest_files_to_update(input_text: str = "") -> List[str]:
     Returns:
         List[str]: List of suggested files to update with reasons
     """
-    # Embedded logging setup
-    memory_bank_path = Path("memory-bank")
-    memory_bank_path.mkdir(exist_ok=True)
-    
-    log_file = memory_bank_path / "Logs.log"
-    handler = logging.handlers.RotatingFileHandler(
-        log_file, maxBytes=1024*1024, backupCount=1
-    )
-    formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(funcName)s - %(message)s'
-    )
-    handler.setFormatter(formatter)
-    logger = logging.getLogger('memory_bank_suggest')
-    logger.setLevel(logging.INFO)
-    logger.addHandler(handler)
+    _ensure_memory_bank()
     
     # Get contributor ID
-    contributor_id = None
-    for env_var in ["GIT_AUTHOR_NAME", "USER", "USERNAME"]:
-        value = os.environ.get(env_var)
-        if value:
-            contributor_id = value.strip()
-            break
-    
-    if not contributor_id:
-        try:
-            result = subprocess.run(
-                ["git", "config", "user.name"], 
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                contributor_id = result.stdout.strip()
-        except:
-            pass
-    
-    if not contributor_id:
-        try:
-            contributor_id = f"user-{socket.gethostname()}"
-        except:
-            contributor_id = "unknown-user"
+    contributor_id = _resolve_contributor_id()
     
     # Generate timestamp
-    timestamp = f"{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')} [{contributor_id}]"
+    timestamp = f"{_utc_timestamp()} [{contributor_id}]"
     
     if not input_text:
         return [f"""
@@ -1143,65 +1252,32 @@ Timestamp: {timestamp}
 """]
     
     # Log the operation
-    logger.info(f"🎯 File update suggestions requested by {contributor_id}: {input_text[:100]}...")
+    _logger.info(f"🎯 File update suggestions requested by {contributor_id}: {input_text[:100]}...")
     
     # Analyze input text for file suggestions - inline logic
-    file_suggestions = {}
+    # Check every distinct keyword once; each rule is then a set lookup
     text_lower = input_text.lower()
+    keyword_hits = {kw for kw in _FILE_UPDATE_KEYWORDS if kw in text_lower}
     
-    # Context files
-    if any(word in text_lower for word in ['overview', 'description', 'purpose', 'goal', 'objective']):
-        file_suggestions['context/overview.md'] = "Project overview and description updates"
-    
-    if any(word in text_lower for word in ['stakeholder', 'team', 'role', 'responsibility', 'owner']):
-        file_suggestions['context/stakeholders.md'] = "Stakeholder information and roles"
-    
-    if any(word in text_lower for word in ['metric', 'kpi', 'success', 'performance', 'measure']):
-        file_suggestions['context/success_metrics.md'] = "Success metrics and KPIs"
-    
-    # Technical specifications
-    if any(word in text_lower for word in ['architecture', 'design', 'pattern', 'structure', 'component']):
-        file_suggestions['tech_specs/system_architecture.md'] = "System architecture and design patterns"
-    
-    if any(word in text_lower for word in ['api', 'endpoint', 'rest', 'graphql', 'interface']):
-        file_suggestions['tech_specs/api_reference.md'] = "API documentation and endpoints"
-    
-    if any(word in text_lower for word in ['data', 'flow', 'pipeline', 'process', 'transformation']):
-        file_suggestions['tech_specs/data_flow.md'] = "Data flow and processing pipelines"
-    
-    if any(word in text_lower for word in ['module', 'service', 'microservice', 'component']):
-        file_suggestions['tech_specs/modules/'] = "Module-specific technical specifications"
-    
-    # DevOps files
-    if any(word in text_lower for word in ['deploy', 'deployment', 'infrastructure', 'server', 'cloud']):
-        file_suggestions['devops/deployment_architecture.md'] = "Deployment and infrastructure setup"
-    
-    if any(word in text_lower for word in ['ci/cd', 'pipeline', 'build', 'test', 'automation']):
-        file_suggestions['devops/ci_cd_pipeline.md'] = "CI/CD pipeline and automation"
-    
-    # Dynamic metadata
-    if any(word in text_lower for word in ['change', 'update', 'modify', 'fix', 'feature']):
-        file_suggestions['dynamic_meta/change_log.md'] = "Change log and modification history"
-    
-    if any(word in text_lower for word in ['decision', 'choice', 'option', 'alternative', 'rationale']):
-        file_suggestions['dynamic_meta/decision_logs.md'] = "Decision logs and rationale"
-    
-    if any(word in text_lower for word in ['config', 'configuration', 'setting', 'environment', 'variable']):
-        file_suggestions['dynamic_meta/config_map.md'] = "Configuration and environment settings"
+    file_suggestions = {
+        path: reason
+        for words, path, reason in _FILE_UPDATE_RULES
+        if not keyword_hits.isdisjoint(words)
+    }
     
     # Check which files exist
     existing_files = []
     missing_files = []
     
+    existing_paths = _existing_memory_bank_paths(file_suggestions)
     for file_path, reason in file_suggestions.items():
-        full_path = memory_bank_path / file_path
         if file_path.endswith('/'):  # Directory suggestion
-            if full_path.exists():
+            if file_path in existing_paths:
                 existing_files.append(f"📁 {file_path} - {reason}")
             else:
                 missing_files.append(f"📁 {file_path} - {reason} (Directory needs creation)")
         else:  # File suggestion
-            if full_path.exists():
+            if file_path in existing_paths:
                 existing_files.append(f"📄 {file_path} - {reason}")
             else:
                 missing_files.append(f"📄 {file_path} - {reason} (File needs creation)")
@@ -1218,7 +1294,7 @@ Timestamp: {timestamp}
         priority_suggestions.append("📄 context/overview.md - Update project overview if needed")
     
     # Log successful suggestion generation
-    logger.info(f"✅ File suggestions generated for {contributor_id}: {len(file_suggestions)} files")
+    _logger.info(f"✅ File suggestions generated for {contributor_id}: {len(file_suggestions)} files")
     
     result = [f"""
 🎯 File Update Suggestions
@@ -1267,49 +1343,13 @@ def smart_project_analysis_and_routing(input_content: str = "") -> str:
     Returns:
         str: Analysis results with routing recommendations
     """
-    # Embedded logging setup
-    memory_bank_path = Path("memory-bank")
-    memory_bank_path.mkdir(exist_ok=True)
-    
-    log_file = memory_bank_path / "Logs.log"
-    handler = logging.handlers.RotatingFileHandler(
-        log_file, maxBytes=1024*1024, backupCount=1
-    )
-    formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(funcName)s - %(message)s'
-    )
-    handler.setFormatter(formatter)
-    logger = logging.getLogger('memory_bank_routing')
-    logger.setLevel(logging.INFO)
-    logger.addHandler(handler)
+    _ensure_memory_bank()
     
     # Get contributor ID
-    contributor_id = None
-    for env_var in ["GIT_AUTHOR_NAME", "USER", "USERNAME"]:
-        value = os.environ.get(env_var)
-        if value:
-            contributor_id = value.strip()
-            break
-    
-    if not contributor_id:
-        try:
-            result = subprocess.run(
-                ["git", "config", "user.name"], 
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                contributor_id = result.stdout.strip()
-        except:
-            pass
-    
-    if not contributor_id:
-        try:
-            contributor_id = f"user-{socket.gethostname()}"
-        except:
-            contributor_id = "unknown-user"
+    contributor_id = _resolve_contributor_id()
     
     # Generate timestamp
-    timestamp = f"{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')} [{contributor_id}]"
+    timestamp = f"{_utc_timestamp()} [{contributor_id}]"
     
     if not input_content:
         return f"""
@@ -1328,10 +1368,12 @@ Timestamp: {timestamp}
 """
     
     # Log the operation
-    logger.info(f"🧠 Smart routing requested by {contributor_id}: {input_content[:100]}...")
+    _logger.info(f"🧠 Smart routing requested by {contributor_id}: {input_content[:100]}...")
     
     # Content analysis and routing logic - all inline
+    # Check every distinct routing keyword once; the rules below are set lookups
     content_lower = input_content.lower()
+    keyword_hits = {kw for kw in _ROUTING_KEYWORDS if kw in content_lower}
     routing_analysis = {
         'primary_category': 'general',
         'confidence': 0.0,
@@ -1340,30 +1382,12 @@ Timestamp: {timestamp}
         'key_topics': []
     }
     
-    # Category scoring
+    # Category scoring: number of distinct indicators found per category
     category_scores = {
-        'context': 0,
-        'tech_specs': 0,
-        'devops': 0,
-        'dynamic_meta': 0
+        category: len(keyword_hits.intersection(indicators))
+        for category, indicators in _ROUTING_CATEGORY_INDICATORS.items()
     }
     
-    # Context indicators
-    context_indicators = ['overview', 'stakeholder', 'business', 'goal', 'objective', 'requirement', 'user', 'customer']
-    category_scores['context'] = sum(1 for indicator in context_indicators if indicator in content_lower)
-    
-    # Technical specifications indicators
-    tech_indicators = ['architecture', 'design', 'pattern', 'structure', 'component']
-    category_scores['tech_specs'] = sum(1 for indicator in tech_indicators if indicator in content_lower)
-    
-    # DevOps indicators
-    devops_indicators = ['deploy', 'infrastructure', 'server', 'cloud', 'pipeline', 'ci/cd', 'monitoring', 'build']
-    category_scores['devops'] = sum(1 for indicator in devops_indicators if indicator in content_lower)
-    
-    # Dynamic metadata indicators
-    meta_indicators = ['change', 'decision', 'config', 'update', 'modify', 'log', 'history', 'version']
-    category_scores['dynamic_meta'] = sum(1 for indicator in meta_indicators if indicator in content_lower)
-    
     # Determine primary category
     max_score = max(category_scores.values())
     if max_score > 0:
@@ -1371,74 +1395,67 @@ Timestamp: {timestamp}
         routing_analysis['confidence'] = max_score / len(input_content.split()) * 100
     
     # Determine content type
-    if any(word in content_lower for word in ['class', 'function', 'method', 'import', 'def', 'var', 'const']):
-        routing_analysis['content_type'] = 'code'
-    elif any(word in content_lower for word in ['# ', '## ', '### ', 'markdown', 'documentation']):
-        routing_analysis['content_type'] = 'documentation'
-    elif any(word in content_lower for word in ['meeting', 'discussion', 'notes', 'agenda']):
-        routing_analysis['content_type'] = 'meeting_notes'
-    elif any(word in content_lower for word in ['decision', 'choice', 'option', 'alternative']):
-        routing_analysis['content_type'] = 'decision_record'
-    elif any(word in content_lower for word in ['bug', 'issue', 'fix', 'error', 'problem']):
-        routing_analysis['content_type'] = 'issue_report'
-    else:
-        routing_analysis['content_type'] = 'general_content'
+    routing_analysis['content_type'] = next(
+        (content_type for words, content_type in _ROUTING_CONTENT_TYPES if not keyword_hits.isdisjoint(words)),
+        'general_content'
+    )
     
     # Generate specific file routing suggestions based on analysis - inline
-    routing_suggestions = []
+    # Keyed by file so the first suggestion for a file wins
+    routing_map = {}
     primary_category = routing_analysis['primary_category']
     content_type = routing_analysis['content_type']
     
     # Category-based routing
     if primary_category == 'context':
-        if 'overview' in input_content.lower():
-            routing_suggestions.append({
+        if 'overview' in keyword_hits:
+            routing_map.setdefault('context/overview.md', {
                 'file': 'context/overview.md',
                 'reason': 'Contains project overview information',
                 'priority': 'high'
             })
-        if any(word in input_content.lower() for word in ['stakeholder', 'team', 'role']):
-            routing_suggestions.append({
+        if not keyword_hits.isdisjoint(('stakeholder', 'team', 'role')):
+            routing_map.setdefault('context/stakeholders.md', {
                 'file': 'context/stakeholders.md',
                 'reason': 'Contains stakeholder information',
                 'priority': 'high'
             })
-        if any(word in input_content.lower() for word in ['metric', 'kpi', 'success', 'performance']):
-            routing_suggestions.append({
+        if not keyword_hits.isdisjoint(('metric', 'kpi', 'success', 'performance')):
+            routing_map.setdefault('context/success_metrics.md', {
                 'file': 'context/success_metrics.md',
                 'reason': 'Contains success metrics and KPIs',
                 'priority': 'medium'
             })
     
     elif primary_category == 'tech_specs':
-        if any(word in input_content.lower() for word in ['architecture', 'design', 'pattern']):
-            routing_suggestions.append({
+        if not keyword_hits.isdisjoint(('architecture', 'design', 'pattern')):
+            routing_map.setdefault('tech_specs/system_architecture.md', {
                 'file': 'tech_specs/system_architecture.md',
                 'reason': 'Contains system architecture information',
                 'priority': 'high'
             })
-        if any(word in input_content.lower() for word in ['api', 'endpoint', 'rest', 'graphql']):
-            routing_suggestions.append({
+        if not keyword_hits.isdisjoint(('api', 'endpoint', 'rest', 'graphql')):
+            routing_map.setdefault('tech_specs/api_reference.md', {
                 'file': 'tech_specs/api_reference.md',
                 'reason': 'Contains API documentation',
                 'priority': 'high'
             })
-        if any(word in input_content.lower() for word in ['data', 'flow', 'pipeline']):
-            routing_suggestions.append({
+        if not keyword_hits.isdisjoint(('data', 'flow', 'pipeline')):
+            routing_map.setdefault('tech_specs/data_flow.md', {
                 'file': 'tech_specs/data_flow.md',
                 'reason': 'Contains data flow information',
                 'priority': 'medium'
             })
     
     elif primary_category == 'devops':
-        if any(word in input_content.lower() for word in ['deploy', 'deployment', 'infrastructure']):
-            routing_suggestions.append({
+        if not keyword_hits.isdisjoint(('deploy', 'deployment', 'infrastructure')):
+            routing_map.setdefault('devops/deployment_architecture.md', {
                 'file': 'devops/deployment_architecture.md',
                 'reason': 'Contains deployment information',
                 'priority': 'high'
             })
-        if any(word in input_content.lower() for word in ['ci/cd', 'pipeline', 'build']):
-            routing_suggestions.append({
+        if not keyword_hits.isdisjoint(('ci/cd', 'pipeline', 'build')):
+            routing_map.setdefault('devops/ci_cd_pipeline.md', {
                 'file': 'devops/ci_cd_pipeline.md',
                 'reason': 'Contains CI/CD pipeline information',
                 'priority': 'high'
@@ -1446,19 +1463,19 @@ Timestamp: {timestamp}
     
     elif primary_category == 'dynamic_meta':
         if content_type == 'decision_record':
-            routing_suggestions.append({
+            routing_map.setdefault('dynamic_meta/decision_logs.md', {
                 'file': 'dynamic_meta/decision_logs.md',
                 'reason': 'Contains decision information',
                 'priority': 'high'
             })
-        if any(word in input_content.lower() for word in ['change', 'update', 'modify']):
-            routing_suggestions.append({
+        if not keyword_hits.isdisjoint(('change', 'update', 'modify')):
+            routing_map.setdefault('dynamic_meta/change_log.md', {
                 'file': 'dynamic_meta/change_log.md',
                 'reason': 'Contains change information',
                 'priority': 'high'
             })
-        if any(word in input_content.lower() for word in ['config', 'configuration', 'setting']):
-            routing_suggestions.append({
+        if not keyword_hits.isdisjoint(('config', 'configuration', 'setting')):
+            routing_map.setdefault('dynamic_meta/config_map.md', {
                 'file': 'dynamic_meta/config_map.md',
                 'reason': 'Contains configuration information',
                 'priority': 'medium'
@@ -1466,40 +1483,28 @@ Timestamp: {timestamp}
     
     # Content type specific routing
     if content_type == 'meeting_notes':
-        routing_suggestions.append({
+        routing_map.setdefault('dynamic_meta/change_log.md', {
             'file': 'dynamic_meta/change_log.md',
             'reason': 'Meeting notes should be logged as changes',
             'priority': 'medium'
         })
     
     if content_type == 'issue_report':
-        routing_suggestions.append({
+        routing_map.setdefault('dynamic_meta/change_log.md', {
             'file': 'dynamic_meta/change_log.md',
             'reason': 'Issue reports should be tracked in change log',
             'priority': 'high'
         })
     
-    # Remove duplicates and sort by priority
-    unique_suggestions = []
-    seen_files = set()
-    for suggestion in routing_suggestions:
-        if suggestion['file'] not in seen_files:
-            unique_suggestions.append(suggestion)
-            seen_files.add(suggestion['file'])
-    
-    # Sort by priority (high first)
-    priority_order = {'high': 0, 'medium': 1, 'low': 2}
-    unique_suggestions.sort(key=lambda x: priority_order.get(x['priority'], 3))
-    
-    routing_suggestions = unique_suggestions
+    # Order by priority (high first), keeping insertion order within a priority
+    by_priority = {'high': [], 'medium': [], 'low': []}
+    for suggestion in routing_map.values():
+        by_priority[suggestion['priority']].append(suggestion)
+    routing_suggestions = by_priority['high'] + by_priority['medium'] + by_priority['low']
     
     # Extract key topics
-    words = input_content.lower().split()
-    key_topics = []
-    topic_keywords = ['api', 'database', 'frontend', 'backend', 'authentication', 'security', 'deployment', 'testing']
-    for keyword in topic_keywords:
-        if keyword in words:
-            key_topics.append(keyword)
+    words = set(content_lower.split())
+    key_topics = [keyword for keyword in _ROUTING_TOPIC_KEYWORDS if keyword in words]
     
     routing_analysis['key_topics'] = key_topics[:5]  # Limit to top 5
     
@@ -1507,15 +1512,15 @@ Timestamp: {timestamp}
     existing_files = []
     missing_files = []
     
+    existing_paths = _existing_memory_bank_paths(s['file'] for s in routing_suggestions)
     for suggestion in routing_suggestions:
-        file_path = memory_bank_path / suggestion['file']
-        if file_path.exists():
+        if suggestion['file'] in existing_paths:
             existing_files.append(suggestion)
         else:
             missing_files.append(suggestion)
     
     # Log successful routing
-    logger.info(f"✅ Smart routing completed for {contributor_id}: {len(routing_suggestions)} suggestions")
+    _logger.info(f"✅ Smart routing completed for {contributor_id}: {len(routing_suggestions)} suggestions")
     
     return f"""
 🧠 Smart Project Analysis & Routing
@@ -1543,8 +1548,8 @@ Key Topics: {', '.join(routing_analysis['key_topics']) if routing_analysis['key_
 - Total suggestions: {len(routing_suggestions)}
 - Existing files: {len(existing_files)}
 - Missing files: {len(missing_files)}
-- High priority: {len([s for s in routing_suggestions if s['priority'] == 'high'])}
-- Medium priority: {len([s for s in routing_suggestions if s['priority'] == 'medium'])}
+- High priority: {len(by_priority['high'])}
+- Medium priority: {len(by_priority['medium'])}
 
 🛠️ RECOMMENDED ACTIONS:
 1. Create missing files using 'generate_memory_bank_template'
@@ -1567,52 +1572,16 @@ def auto_detect_project_changes() -> str:
     Returns:
         str: Detected changes and update suggestions
     """
-    # Embedded logging setup
-    memory_bank_path = Path("memory-bank")
-    memory_bank_path.mkdir(exist_ok=True)
-    
-    log_file = memory_bank_path / "Logs.log"
-    handler = logging.handlers.RotatingFileHandler(
-        log_file, maxBytes=1024*1024, backupCount=1
-    )
-    formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(funcName)s - %(message)s'
-    )
-    handler.setFormatter(formatter)
-    logger = logging.getLogger('memory_bank_detect')
-    logger.setLevel(logging.INFO)
-    logger.addHandler(handler)
+    _ensure_memory_bank()
     
     # Get contributor ID
-    contributor_id = None
-    for env_var in ["GIT_AUTHOR_NAME", "USER", "USERNAME"]:
-        value = os.environ.get(env_var)
-        if value:
-            contributor_id = value.strip()
-            break
-    
-    if not contributor_id:
-        try:
-            result = subprocess.run(
-                ["git", "config", "user.name"], 
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                contributor_id = result.stdout.strip()
-        except:
-            pass
-    
-    if not contributor_id:
-        try:
-            contributor_id = f"user-{socket.gethostname()}"
-        except:
-            contributor_id = "unknown-user"
+    contributor_id = _resolve_contributor_id()
     
     # Generate timestamp
-    timestamp = f"{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')} [{contributor_id}]"
+    timestamp = f"{_utc_timestamp()} [{contributor_id}]"
     
     # Log the operation
-    logger.info(f"🔍 Auto-detection requested by {contributor_id}")
+    _logger.info(f"🔍 Auto-detection requested by {contributor_id}")
     
     # Detect git changes - inline logic
     git_changes = {
@@ -1624,38 +1593,40 @@ def auto_detect_project_changes() -> str:
     }
     
     try:
-        # Check if git is available
-        result = subprocess.run(['git', 'status'], capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            git_changes['git_available'] = True
-            
-            # Get recent commits (last 5)
-            commits_result = subprocess.run(
-                ['git', 'log', '--oneline', '-5'], 
+        # Get recent commits (last 5) and modified files concurrently; git is
+        # available when the status call succeeds
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            commits_future = executor.submit(
+                subprocess.run, ['git', 'log', '--oneline', '-5'],
+                capture_output=True, text=True, timeout=10
+            )
+            status_future = executor.submit(
+                subprocess.run, ['git', 'status', '--porcelain'],
                 capture_output=True, text=True, timeout=10
             )
+            commits_result = commits_future.result()
+            status_result = status_future.result()
+        
+        if status_result.returncode == 0:
+            git_changes['git_available'] = True
+            
             if commits_result.returncode == 0:
                 git_changes['recent_commits'] = commits_result.stdout.strip().split('\n')
             
             # Get modified files
-            status_result = subprocess.run(
-                ['git', 'status', '--porcelain'], 
-                capture_output=True, text=True, timeout=10
-            )
-            if status_result.returncode == 0:
-                for line in status_result.stdout.strip().split('\n'):
-                    if line:
-                        status_code = line[:2]
-                        file_path = line[3:]
-                        if status_code.strip() == 'M':
-                            git_changes['modified_files'].append(file_path)
-                        elif status_code.strip() in ['A', '??']:
-                            git_changes['new_files'].append(file_path)
-                        elif status_code.strip() == 'D':
-                            git_changes['deleted_files'].append(file_path)
+            for line in status_result.stdout.strip().split('\n'):
+                if line:
+                    status_code = line[:2]
+                    file_path = line[3:]
+                    if status_code.strip() == 'M':
+                        git_changes['modified_files'].append(file_path)
+                    elif status_code.strip() in ['A', '??']:
+                        git_changes['new_files'].append(file_path)
+                    elif status_code.strip() == 'D':
+                        git_changes['deleted_files'].append(file_path)
     
     except Exception as e:
-        logger.warning(f"Git detection failed: {str(e)}")
+        _logger.warning(f"Git detection failed: {str(e)}")
     
     # Detect file system changes - inline logic
     file_changes = {
@@ -1665,32 +1636,14 @@ def auto_detect_project_changes() -> str:
     }
     
     try:
-        # Get recent files (modified in last 24 hours)
-        current_time = datetime.now().timestamp()
-        for file_path in Path('.').rglob('*'):
-            if file_path.is_file() and not file_path.name.startswith('.'):
-                try:
-                    mod_time = file_path.stat().st_mtime
-                    if current_time - mod_time < 86400:  # 24 hours
-                        file_changes['recent_files'].append(str(file_path))
-                except:
-                    continue
-        
-        # Limit to 10 most recent
-        file_changes['recent_files'] = file_changes['recent_files'][:10]
-        
-        # Detect config files
-        config_patterns = ['*.json', '*.yaml', '*.yml', '*.toml', '*.ini', '*.conf']
-        for pattern in config_patterns:
-            for file_path in Path('.').rglob(pattern):
-                if file_path.is_file():
-                    file_changes['config_files'].append(str(file_path))
-        
-        # Limit config files
-        file_changes['config_files'] = file_changes['config_files'][:10]
+        # Get recent files (modified in last 24 hours) and config files in a
+        # single walk, limited to 10 of each
+        file_changes['recent_files'], file_changes['config_files'] = _scan_project_files(
+            '.', time.time() - 86400
+        )
     
     except Exception as e:
-        logger.warning(f"File detection failed: {str(e)}")
+        _logger.warning(f"File detection failed: {str(e)}")
     
     # Analyze the impact of detected changes - inline logic
     impact_analysis = {
@@ -1754,15 +1707,15 @@ def auto_detect_project_changes() -> str:
     existing_updates = []
     missing_updates = []
     
+    existing_paths = _existing_memory_bank_paths(u['file'] for u in impact_analysis['suggested_updates'])
     for update in impact_analysis['suggested_updates']:
-        file_path = memory_bank_path / update['file']
-        if file_path.exists():
+        if update['file'] in existing_paths:
             existing_updates.append(update)
         else:
             missing_updates.append(update)
     
     # Log successful detection
-    logger.info(f"✅ Auto-detection completed for {contributor_id}: {len(impact_analysis['suggested_updates'])} suggestions")
+    _logger.info(f"✅ Auto-detection completed for {contributor_id}: {len(impact_analysis['suggested_updates'])} suggestions")
     
     return f"""
 🔍 Auto-Detect Project Changes
@@ -1815,12 +1768,11 @@ async def memory_bank_guide(section: str) -> tuple[str, str]:
     Args:
         section: The section of the guide to retrieve
     """
-    if section in GUIDES:
-        content = f"# Memory Bank Guide: {section}\n\n{GUIDES[section]}"
+    if section in GUIDE_MODULES:
+        content = f"# Memory Bank Guide: {section}\n\n{_load_guide(section)}"
         return content, "text/markdown"
     else:
-        available_guides = ", ".join(GUIDES.keys())
-        return f"Guide for {section} not found. Available guides: {available_guides}", "text/plain"
+        return _GUIDE_NOT_FOUND.format(section), "text/plain"
     
 
 def main():